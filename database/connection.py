@@ -11,6 +11,9 @@ logger = logging.getLogger(__name__)
 
 
 class AsyncDatabaseManager:
+    # Persistent connections kept by the engine; concurrency limits elsewhere are sized against it
+    POOL_SIZE = 5
+
     def __init__(self, database_url: str):
         # Convert postgresql:// to postgresql+asyncpg:// for async support
         if database_url.startswith("postgresql://"):
@@ -19,7 +22,7 @@ class AsyncDatabaseManager:
         self.engine = create_async_engine(
             database_url,
             # Connection pool settings for async
-            pool_size=5,
+            pool_size=self.POOL_SIZE,
             max_overflow=10,
             pool_timeout=30,
             pool_recycle=1800,  # Recycle connections after 30 minutes
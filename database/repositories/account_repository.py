@@ -72,43 +72,45 @@ class AccountRepository:
 
         return sampled
 
-    async def save_account_state(self, account_name: str, connector_name: str, tokens_info: List[Dict],
-                                snapshot_timestamp: Optional[datetime] = None) -> AccountState:
+    async def save_account_states(self, accounts_state: Dict[str, Dict[str, List[Dict]]],
+                                  snapshot_timestamp: Optional[datetime] = None) -> List[AccountState]:
         """
-        Save account state with token information to the database.
-        If snapshot_timestamp is provided, use it instead of server default.
+        Save a full account snapshot (account -> connector -> tokens_info) in one flush.
 
-        Note: this method does NOT commit; it only flushes to obtain the AccountState id.
+        Token states are attached through the AccountState relationship, so the unit of work
+        emits one batched INSERT per table instead of a flush round-trip per account/connector.
+        Connectors with no token data are skipped. If snapshot_timestamp is provided, it is used
+        instead of the server default.
+
+        Note: this method does NOT commit; it only flushes to obtain the AccountState ids.
         The caller's session context owns the transaction and commits once
         (e.g. get_session_context commits on successful exit), so a snapshot spanning
         multiple accounts/connectors persists atomically in a single transaction.
         """
-        account_state_data = {
-            "account_name": account_name,
-            "connector_name": connector_name
-        }
-        
-        # If a specific timestamp is provided, use it instead of server default
-        if snapshot_timestamp:
-            account_state_data["timestamp"] = snapshot_timestamp
-            
-        account_state = AccountState(**account_state_data)
-        
-        self.session.add(account_state)
-        await self.session.flush()  # Get the ID
-        
-        for token_info in tokens_info:
-            token_state = TokenState(
-                account_state_id=account_state.id,
-                token=token_info["token"],
-                units=Decimal(str(token_info["units"])),
-                price=Decimal(str(token_info["price"])),
-                value=Decimal(str(token_info["value"])),
-                available_units=Decimal(str(token_info["available_units"]))
-            )
-            self.session.add(token_state)
-
-        return account_state
+        account_states = []
+        for account_name, connectors in accounts_state.items():
+            for connector_name, tokens_info in connectors.items():
+                if not tokens_info:
+                    continue
+                account_state = AccountState(account_name=account_name, connector_name=connector_name)
+                if snapshot_timestamp:
+                    account_state.timestamp = snapshot_timestamp
+                account_state.token_states = [
+                    TokenState(
+                        token=token_info["token"],
+                        units=Decimal(str(token_info["units"])),
+                        price=Decimal(str(token_info["price"])),
+                        value=Decimal(str(token_info["value"])),
+                        available_units=Decimal(str(token_info["available_units"]))
+                    )
+                    for token_info in tokens_info
+                ]
+                account_states.append(account_state)
+
+        if account_states:
+            self.session.add_all(account_states)
+            await self.session.flush()
+        return account_states
 
     async def get_latest_account_states(self) -> Dict[str, Dict[str, List[Dict]]]:
         """
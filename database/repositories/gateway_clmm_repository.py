@@ -122,6 +122,7 @@ class GatewayCLMMRepository:
         trading_pair: Optional[str] = None,
         status: Optional[str] = None,
         position_addresses: Optional[List[str]] = None,
+        pool_address: Optional[str] = None,
         limit: int = 100,
         offset: int = 0
     ) -> List[GatewayCLMMPosition]:
@@ -141,6 +142,8 @@ class GatewayCLMMRepository:
             query = query.where(GatewayCLMMPosition.status == status)
         if position_addresses:
             query = query.where(GatewayCLMMPosition.position_address.in_(position_addresses))
+        if pool_address:
+            query = query.where(GatewayCLMMPosition.pool_address == pool_address)
 
         # Apply ordering and pagination
         query = query.order_by(GatewayCLMMPosition.created_at.desc())
@@ -260,13 +263,12 @@ class GatewayCLMMRepository:
         limit: int = 100
     ) -> List[GatewayCLMMEvent]:
         """Get all events for a position."""
-        # First get the position
-        position = await self.get_position_by_address(position_address)
-        if not position:
-            return []
-
-        # Then get its events
-        query = select(GatewayCLMMEvent).where(GatewayCLMMEvent.position_id == position.id)
+        # Resolve the position through a join so events are fetched in a single round-trip
+        query = (
+            select(GatewayCLMMEvent)
+            .join(GatewayCLMMPosition, GatewayCLMMEvent.position_id == GatewayCLMMPosition.id)
+            .where(GatewayCLMMPosition.position_address == position_address)
+        )
 
         if event_type:
             query = query.where(GatewayCLMMEvent.event_type == event_type)
@@ -88,6 +88,9 @@ logging.getLogger('services.mqtt_manager').setLevel(logging.INFO)
 # Get settings from Pydantic Settings
 username = settings.security.username
 password = settings.security.password
+# Encoded once so auth_user only encodes the presented credentials per request
+correct_username_bytes = f"{username}".encode("utf8")
+correct_password_bytes = f"{password}".encode("utf8")
 
 # Security setup
 security = HTTPBasic()
@@ -334,6 +337,7 @@ async def lifespan(app: FastAPI):
     market_data_service.stop()
     await connector_service.stop_all()
     docker_service.cleanup()
+    await gateway_clmm.close_raydium_session()
     await db_manager.close()
 
     logging.info("All services stopped")
@@ -393,12 +397,10 @@ def auth_user(
 ):
     """Authenticate user using HTTP Basic Auth"""
     current_username_bytes = credentials.username.encode("utf8")
-    correct_username_bytes = f"{username}".encode("utf8")
     is_correct_username = secrets.compare_digest(
         current_username_bytes, correct_username_bytes
     )
     current_password_bytes = credentials.password.encode("utf8")
-    correct_password_bytes = f"{password}".encode("utf8")
     is_correct_password = secrets.compare_digest(
         current_password_bytes, correct_password_bytes
     )
@@ -3,7 +3,10 @@ Gateway CLMM Router - Handles DEX CLMM liquidity operations via Hummingbot Gatew
 Supports CLMM connectors (Meteora, Raydium, Uniswap V3) for concentrated liquidity positions.
 """
 import asyncio
+import json
 import logging
+import time
+from collections import OrderedDict
 from decimal import Decimal
 from typing import List, Optional
 
@@ -29,14 +32,57 @@ from models import (
     TimeBasedMetrics,
 )
 from services.accounts_service import AccountsService
+from services.gateway_client import GatewayClient
+
+try:
+    # Optional faster decoder for Raydium API responses
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Gateway CLMM"], prefix="/gateway")
 
+# Max positions refreshed from Gateway at once. Each refresh holds its own session, so this stays
+# below the database pool size to leave connections for requests and background tasks.
+POSITION_REFRESH_CONCURRENCY = max(1, AsyncDatabaseManager.POOL_SIZE - 2)
+
+# Shared HTTP session for the Raydium API so repeated pool-info lookups reuse keep-alive
+# connections instead of paying DNS + TCP + TLS setup on every request.
+_raydium_session: Optional[aiohttp.ClientSession] = None
+
+# Seconds a Raydium pool-info response is reused before hitting the public API again
+RAYDIUM_POOL_INFO_TTL_SECONDS = 5.0
+# Maximum cached Raydium pool-info responses (oldest evicted first)
+RAYDIUM_POOL_INFO_CACHE_MAX_ENTRIES = 256
+# Recent Raydium pool-info responses keyed by pool address: (monotonic fetch time, pool data).
+# Ordered by insertion time, so expired entries are always at the front.
+_raydium_pool_info_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+
+
+def _get_raydium_session() -> aiohttp.ClientSession:
+    """Lazily create the shared Raydium API session (must be called from the running event loop)."""
+    global _raydium_session
+    if _raydium_session is None or _raydium_session.closed:
+        _raydium_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _raydium_session
+
+
+async def close_raydium_session():
+    """Close the shared Raydium API session. Called on application shutdown."""
+    global _raydium_session
+    if _raydium_session is not None and not _raydium_session.closed:
+        await _raydium_session.close()
+    _raydium_session = None
+    _raydium_pool_info_cache.clear()
+
 
 async def fetch_pools_from_gateway(
-    gateway_url: str,
+    gateway_client: GatewayClient,
     connector: str,
     network: str = "mainnet-beta",
     page: int = 0,
@@ -48,8 +94,11 @@ async def fetch_pools_from_gateway(
     """
     Fetch pools from Gateway's fetch-pools endpoint.
 
+    Uses the Gateway client's shared session, so requests reuse pooled connections
+    (and the client certificate when the Gateway is secured).
+
     Args:
-        gateway_url: Gateway base URL (e.g., http://localhost:15888)
+        gateway_client: Gateway client to issue the request with
         connector: Connector name (meteora, orca)
         network: Network ID (default: mainnet-beta)
         page: Page number (0-based)
@@ -62,63 +111,75 @@ async def fetch_pools_from_gateway(
         Dictionary with pools from Gateway, or None if failed
     """
     try:
-        url = f"{gateway_url}/connectors/{connector}/clmm/fetch-pools"
-        params = {
-            "network": network,
-            "limit": limit,
-        }
-
-        if page > 0:
-            params["page"] = page
-        if query:
-            params["query"] = query
-        if sort_by:
-            params["sortBy"] = sort_by
-        if not include_unverified:
-            params["includeUnverified"] = "false"
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers={"accept": "application/json"}) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return data
-    except aiohttp.ClientError as e:
-        logger.error(f"Failed to fetch pools from Gateway: {e}")
-        return None
+        data = await gateway_client.clmm_fetch_pools(
+            connector=connector,
+            network=network,
+            page=page,
+            limit=limit,
+            query=query,
+            sort_by=sort_by,
+            include_unverified=include_unverified
+        )
+        if data is None or "error" in data:
+            logger.error(f"Failed to fetch pools from Gateway: {data.get('error') if data else 'connection error'}")
+            return None
+        return data
     except Exception as e:
         logger.error(f"Error fetching pools from Gateway: {e}", exc_info=True)
         return None
 
 
+def _evict_expired_raydium_pool_info():
+    """Drop cached Raydium pool-info responses older than RAYDIUM_POOL_INFO_TTL_SECONDS."""
+    now = time.monotonic()
+    while _raydium_pool_info_cache:
+        fetched_at, _ = next(iter(_raydium_pool_info_cache.values()))
+        if now - fetched_at < RAYDIUM_POOL_INFO_TTL_SECONDS:
+            break
+        _raydium_pool_info_cache.popitem(last=False)
+
+
 async def fetch_raydium_pool_info(pool_address: str) -> Optional[dict]:
     """
     Fetch pool info from Raydium API.
 
+    Successful responses are reused for RAYDIUM_POOL_INFO_TTL_SECONDS so repeated lookups of
+    the same pool don't hit the rate-limited public API.
+
     Args:
         pool_address: Pool contract address
 
     Returns:
         Dictionary with pool info from Raydium API, or None if failed
     """
+    _evict_expired_raydium_pool_info()
+    cached = _raydium_pool_info_cache.get(pool_address)
+    if cached is not None:
+        return cached[1]
+
     try:
         url = f"https://api-v3.raydium.io/pools/info/ids?ids={pool_address}"
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers={"accept": "application/json"}) as response:
-                response.raise_for_status()
-                data = await response.json()
-
-                if not data.get("success"):
-                    logger.error(f"Raydium API returned unsuccessful response: {data}")
-                    return None
-
-                # Extract the first pool from the data list
-                pools_data = data.get("data", [])
-                if not pools_data:
-                    logger.error(f"Raydium API returned empty data for pool: {pool_address}")
-                    return None
-
-                # Return the pool data directly (not wrapped in data key)
-                return pools_data[0]
+        session = _get_raydium_session()
+        async with session.get(url, headers={"accept": "application/json"}) as response:
+            response.raise_for_status()
+            data = await response.json(loads=_json_loads)
+
+            if not data.get("success"):
+                logger.error(f"Raydium API returned unsuccessful response: {data}")
+                return None
+
+            # Extract the first pool from the data list
+            pools_data = data.get("data", [])
+            if not pools_data:
+                logger.error(f"Raydium API returned empty data for pool: {pool_address}")
+                return None
+
+            # Return the pool data directly (not wrapped in data key)
+            _raydium_pool_info_cache[pool_address] = (time.monotonic(), pools_data[0])
+            _raydium_pool_info_cache.move_to_end(pool_address)
+            while len(_raydium_pool_info_cache) > RAYDIUM_POOL_INFO_CACHE_MAX_ENTRIES:
+                _raydium_pool_info_cache.popitem(last=False)
+            return pools_data[0]
     except aiohttp.ClientError as e:
         logger.error(f"Failed to fetch pool info from Raydium API: {e}")
         return None
@@ -153,8 +214,9 @@ def transform_raydium_to_clmm_response(raydium_data: dict, pool_address: str) ->
     quote_amount = Decimal(str(raydium_data.get("mintAmountB", 0)))
 
     # Get fee rate (convert from decimal to percentage, e.g., 0.0025 -> 0.25%)
+    # Convert to Decimal before scaling so float error (e.g. 0.0001 * 100) isn't carried into the result
     fee_rate = raydium_data.get("feeRate", 0.0025)
-    fee_pct = Decimal(str(fee_rate * 100))
+    fee_pct = Decimal(str(fee_rate)) * 100
 
     # Check if this is a CLMM (Concentrated) pool
     pool_type = raydium_data.get("type", "Standard")
@@ -200,6 +262,16 @@ def get_transaction_status_from_response(gateway_response: dict) -> str:
     return "SUBMITTED"
 
 
+def optional_float(value) -> Optional[float]:
+    """
+    Convert an optional numeric value (Decimal, str or number) to float.
+
+    Falsy values (None, 0, empty string) map to None, matching how event and
+    position amounts are recorded when Gateway does not report them.
+    """
+    return float(value) if value else None
+
+
 def get_native_gas_token(chain: str) -> str:
     """
     Get the native gas token symbol for a blockchain.
@@ -224,6 +296,24 @@ def get_native_gas_token(chain: str) -> str:
     return gas_token_map.get(chain.lower(), "UNKNOWN")
 
 
+async def _get_position_pool_and_wallet(
+    db_manager: AsyncDatabaseManager,
+    position_address: str
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Look up the pool address and wallet address recorded for a position.
+
+    Returns:
+        (pool_address, wallet_address), each None if the position is not in the database
+    """
+    async with db_manager.get_session_context() as session:
+        clmm_repo = GatewayCLMMRepository(session)
+        db_position = await clmm_repo.get_position_by_address(position_address)
+        if db_position:
+            return db_position.pool_address, db_position.wallet_address
+    return None, None
+
+
 async def _refresh_position_data(position, accounts_service: AccountsService, clmm_repo: GatewayCLMMRepository):
     """
     Refresh position data from Gateway and update database.
@@ -309,8 +399,8 @@ async def _refresh_position_data(position, accounts_service: AccountsService, cl
                 quote_fee_pending=quote_fee_pending
             )
 
-        logger.debug(f"Refreshed position {position.position_address}: price={current_price}, in_range={in_range}, "
-                    f"base={base_token_amount}, quote={quote_token_amount}")
+        logger.debug("Refreshed position %s: price=%s, in_range=%s, base=%s, quote=%s",
+                     position.position_address, current_price, in_range, base_token_amount, quote_token_amount)
 
     except Exception as e:
         logger.error(f"Error refreshing position {position.position_address}: {e}", exc_info=True)
@@ -374,11 +464,13 @@ async def get_clmm_pool_info(
         # Parse network_id
         chain, network_name = accounts_service.gateway_client.parse_network_id(network)
 
-        # Get pool info from Gateway using the CLMM-specific endpoint
+        # Get pool info from Gateway using the CLMM-specific endpoint; always fetch the live
+        # price for this endpoint rather than serving a cached response
         result = await accounts_service.gateway_client.clmm_pool_info(
             connector=connector,
             network=network_name,
-            pool_address=pool_address
+            pool_address=pool_address,
+            use_cache=False
         )
 
         if result is None:
@@ -436,9 +528,6 @@ async def get_clmm_pools(
                 detail=f"Pool listing not supported for connector '{connector}'. Supported: {', '.join(supported_connectors)}"
             )
 
-        # Get Gateway URL from accounts service
-        gateway_url = accounts_service.gateway_base_url
-
         logger.info(f"Fetching pools from Gateway ({connector}, page={page}, limit={limit}, query={search_term})")
 
         # Build sort_by for Gateway (connector-specific format)
@@ -452,7 +541,7 @@ async def get_clmm_pools(
                 sort_by = sort_key
 
         gateway_data = await fetch_pools_from_gateway(
-            gateway_url=gateway_url,
+            gateway_client=accounts_service.gateway_client,
             connector=connector.lower(),
             page=page,
             limit=limit,
@@ -534,17 +623,18 @@ async def open_clmm_position(
         # Parse network_id
         chain, network = accounts_service.gateway_client.parse_network_id(request.network)
 
-        # Get wallet address
-        wallet_address = await accounts_service.gateway_client.get_wallet_address_or_default(
-            chain=chain,
-            wallet_address=request.wallet_address
-        )
-
-        # Get pool info to extract trading pair for database
-        pool_info = await accounts_service.gateway_client.clmm_pool_info(
-            connector=request.connector,
-            network=network,
-            pool_address=request.pool_address
+        # Resolve wallet address and fetch pool info (trading pair + entry price for the database)
+        # concurrently - neither depends on the other, so the open only waits for one round-trip.
+        wallet_address, pool_info = await asyncio.gather(
+            accounts_service.gateway_client.get_wallet_address_or_default(
+                chain=chain,
+                wallet_address=request.wallet_address
+            ),
+            accounts_service.gateway_client.clmm_pool_info(
+                connector=request.connector,
+                network=network,
+                pool_address=request.pool_address
+            )
         )
 
         # Extract tokens from pool info
@@ -552,7 +642,7 @@ async def open_clmm_position(
         quote_token_address = pool_info.get("quoteTokenAddress", "")
 
         # Extract entry price from pool info (current pool price at time of opening)
-        entry_price = float(pool_info.get("price", 0)) if pool_info.get("price") else None
+        entry_price = optional_float(pool_info.get("price"))
         if entry_price:
             logger.info(f"Entry price for position: {entry_price}")
 
@@ -561,16 +651,22 @@ async def open_clmm_position(
         quote = quote_token_address if quote_token_address else "UNKNOWN"
         trading_pair = f"{base}-{quote}"
 
+        # Convert request amounts/prices once and reuse them for the Gateway call and DB records
+        lower_price = float(request.lower_price)
+        upper_price = float(request.upper_price)
+        base_token_amount = optional_float(request.base_token_amount)
+        quote_token_amount = optional_float(request.quote_token_amount)
+
         # Open position
         result = await accounts_service.gateway_client.clmm_open_position(
             connector=request.connector,
             network=network,
             wallet_address=wallet_address,
             pool_address=request.pool_address,
-            lower_price=float(request.lower_price),
-            upper_price=float(request.upper_price),
-            base_token_amount=float(request.base_token_amount) if request.base_token_amount else None,
-            quote_token_amount=float(request.quote_token_amount) if request.quote_token_amount else None,
+            lower_price=lower_price,
+            upper_price=upper_price,
+            base_token_amount=base_token_amount,
+            quote_token_amount=quote_token_amount,
             slippage_pct=float(request.slippage_pct) if request.slippage_pct else 1.0,
             extra_params=request.extra_params
         )
@@ -622,16 +718,16 @@ async def open_clmm_position(
                     "base_token": base,
                     "quote_token": quote,
                     "status": "OPEN",
-                    "lower_price": float(request.lower_price),
-                    "upper_price": float(request.upper_price),
+                    "lower_price": lower_price,
+                    "upper_price": upper_price,
                     "percentage": percentage,
                     "entry_price": entry_price,  # Pool price when position opened
                     "current_price": entry_price,  # Same as entry at open time, updated by poller
-                    "initial_base_token_amount": float(request.base_token_amount) if request.base_token_amount else 0,
-                    "initial_quote_token_amount": float(request.quote_token_amount) if request.quote_token_amount else 0,
-                    "position_rent": float(position_rent) if position_rent else None,
-                    "base_token_amount": float(request.base_token_amount) if request.base_token_amount else 0,
-                    "quote_token_amount": float(request.quote_token_amount) if request.quote_token_amount else 0,
+                    "initial_base_token_amount": base_token_amount or 0,
+                    "initial_quote_token_amount": quote_token_amount or 0,
+                    "position_rent": optional_float(position_rent),
+                    "base_token_amount": base_token_amount or 0,
+                    "quote_token_amount": quote_token_amount or 0,
                     "in_range": "UNKNOWN"  # Will be updated by poller
                 }
 
@@ -643,9 +739,9 @@ async def open_clmm_position(
                     "position_id": position.id,
                     "transaction_hash": transaction_hash,
                     "event_type": "OPEN",
-                    "base_token_amount": float(request.base_token_amount) if request.base_token_amount else None,
-                    "quote_token_amount": float(request.quote_token_amount) if request.quote_token_amount else None,
-                    "gas_fee": float(gas_fee) if gas_fee else None,
+                    "base_token_amount": base_token_amount,
+                    "quote_token_amount": quote_token_amount,
+                    "gas_fee": optional_float(gas_fee),
                     "gas_token": gas_token,
                     "status": tx_status
                 }
@@ -715,8 +811,8 @@ async def add_liquidity_to_clmm_position(
             network=network,
             wallet_address=wallet_address,
             position_address=request.position_address,
-            base_token_amount=float(request.base_token_amount) if request.base_token_amount else None,
-            quote_token_amount=float(request.quote_token_amount) if request.quote_token_amount else None,
+            base_token_amount=optional_float(request.base_token_amount),
+            quote_token_amount=optional_float(request.quote_token_amount),
             slippage_pct=float(request.slippage_pct) if request.slippage_pct else 1.0
         )
 
@@ -744,9 +840,9 @@ async def add_liquidity_to_clmm_position(
                         "position_id": position.id,
                         "transaction_hash": transaction_hash,
                         "event_type": "ADD_LIQUIDITY",
-                        "base_token_amount": float(request.base_token_amount) if request.base_token_amount else None,
-                        "quote_token_amount": float(request.quote_token_amount) if request.quote_token_amount else None,
-                        "gas_fee": float(gas_fee) if gas_fee else None,
+                        "base_token_amount": optional_float(request.base_token_amount),
+                        "quote_token_amount": optional_float(request.quote_token_amount),
+                        "gas_fee": optional_float(gas_fee),
                         "gas_token": gas_token,
                         "status": tx_status
                     }
@@ -836,7 +932,7 @@ async def remove_liquidity_from_clmm_position(
                         "transaction_hash": transaction_hash,
                         "event_type": "REMOVE_LIQUIDITY",
                         "percentage": float(request.percentage),
-                        "gas_fee": float(gas_fee) if gas_fee else None,
+                        "gas_fee": optional_float(gas_fee),
                         "gas_token": gas_token,
                         "status": tx_status
                     }
@@ -880,23 +976,17 @@ async def close_clmm_position(
         Transaction hash and collected fee amounts
     """
     try:
-        if not await accounts_service.gateway_client.ping():
+        # Check Gateway and look up pool_address and wallet_address in the database concurrently
+        gateway_available, (pool_address, wallet_address) = await asyncio.gather(
+            accounts_service.gateway_client.ping(),
+            _get_position_pool_and_wallet(db_manager, request.position_address)
+        )
+        if not gateway_available:
             raise HTTPException(status_code=503, detail="Gateway service is not available")
 
         # Parse network_id
         chain, network = accounts_service.gateway_client.parse_network_id(request.network)
 
-        # Get pool_address and wallet_address from database
-        pool_address = None
-        wallet_address = None
-
-        async with db_manager.get_session_context() as session:
-            clmm_repo = GatewayCLMMRepository(session)
-            db_position = await clmm_repo.get_position_by_address(request.position_address)
-            if db_position:
-                pool_address = db_position.pool_address
-                wallet_address = db_position.wallet_address
-
         # If not in database, use default wallet
         if not wallet_address:
             wallet_address = await accounts_service.gateway_client.get_wallet_address_or_default(
@@ -981,9 +1071,9 @@ async def close_clmm_position(
                         "position_id": position.id,
                         "transaction_hash": transaction_hash,
                         "event_type": "CLOSE",
-                        "base_fee_collected": float(base_fee_collected) if base_fee_collected else None,
-                        "quote_fee_collected": float(quote_fee_collected) if quote_fee_collected else None,
-                        "gas_fee": float(gas_fee) if gas_fee else None,
+                        "base_fee_collected": optional_float(base_fee_collected),
+                        "quote_fee_collected": optional_float(quote_fee_collected),
+                        "gas_fee": optional_float(gas_fee),
                         "gas_token": gas_token,
                         "status": tx_status
                     }
@@ -1079,23 +1169,17 @@ async def collect_fees_from_clmm_position(
         Transaction hash and collected fee amounts
     """
     try:
-        if not await accounts_service.gateway_client.ping():
+        # Check Gateway and look up pool_address and wallet_address in the database concurrently
+        gateway_available, (pool_address, wallet_address) = await asyncio.gather(
+            accounts_service.gateway_client.ping(),
+            _get_position_pool_and_wallet(db_manager, request.position_address)
+        )
+        if not gateway_available:
             raise HTTPException(status_code=503, detail="Gateway service is not available")
 
         # Parse network_id
         chain, network = accounts_service.gateway_client.parse_network_id(request.network)
 
-        # Get pool_address and wallet_address from database
-        pool_address = None
-        wallet_address = None
-
-        async with db_manager.get_session_context() as session:
-            clmm_repo = GatewayCLMMRepository(session)
-            db_position = await clmm_repo.get_position_by_address(request.position_address)
-            if db_position:
-                pool_address = db_position.pool_address
-                wallet_address = db_position.wallet_address
-
         # If not in database, use default wallet
         if not wallet_address:
             wallet_address = await accounts_service.gateway_client.get_wallet_address_or_default(
@@ -1181,9 +1265,9 @@ async def collect_fees_from_clmm_position(
                         "position_id": position.id,
                         "transaction_hash": transaction_hash,
                         "event_type": "COLLECT_FEES",
-                        "base_fee_collected": float(base_fee_collected) if base_fee_collected else None,
-                        "quote_fee_collected": float(quote_fee_collected) if quote_fee_collected else None,
-                        "gas_fee": float(gas_fee) if gas_fee else None,
+                        "base_fee_collected": optional_float(base_fee_collected),
+                        "quote_fee_collected": optional_float(quote_fee_collected),
+                        "gas_fee": optional_float(gas_fee),
                         "gas_token": gas_token,
                         "status": tx_status
                     }
@@ -1360,6 +1444,7 @@ async def search_clmm_positions(
     trading_pair: Optional[str] = None,
     status: Optional[str] = None,
     position_addresses: Optional[List[str]] = Query(None),
+    pool_address: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
     refresh: bool = False,
@@ -1376,6 +1461,7 @@ async def search_clmm_positions(
         trading_pair: Filter by trading pair (e.g., 'SOL-USDC')
         status: Filter by status (OPEN, CLOSED)
         position_addresses: Filter by specific position addresses (list of addresses)
+        pool_address: Filter by pool address
         limit: Max results (default 50, max 1000)
         offset: Pagination offset
         refresh: If True, refresh position data from Gateway before returning (default False)
@@ -1400,6 +1486,7 @@ async def search_clmm_positions(
                     trading_pair=trading_pair,
                     status=status,
                     position_addresses=position_addresses,
+                    pool_address=pool_address,
                     limit=limit,
                     offset=offset
                 )
@@ -1416,19 +1503,25 @@ async def search_clmm_positions(
                     for pos in positions_to_refresh
                 ]
 
-            # Refresh each position in a separate session
+            # Refresh positions concurrently, each in a separate session. The semaphore keeps the
+            # fan-out below the database connection pool size.
             logger.info(f"Refreshing {len(position_details)} positions from Gateway")
-            for pos_detail in position_details:
-                try:
-                    async with db_manager.get_session_context() as session:
-                        clmm_repo = GatewayCLMMRepository(session)
-                        # Get position again in this session
-                        position = await clmm_repo.get_position_by_address(pos_detail["position_address"])
-                        if position:
-                            await _refresh_position_data(position, accounts_service, clmm_repo)
-                except Exception as e:
-                    logger.warning(f"Failed to refresh position {pos_detail['position_address']}: {e}")
-                    # Continue with other positions even if one fails
+            semaphore = asyncio.Semaphore(POSITION_REFRESH_CONCURRENCY)
+
+            async def refresh_one(pos_detail: dict):
+                async with semaphore:
+                    try:
+                        async with db_manager.get_session_context() as session:
+                            clmm_repo = GatewayCLMMRepository(session)
+                            # Get position again in this session
+                            position = await clmm_repo.get_position_by_address(pos_detail["position_address"])
+                            if position:
+                                await _refresh_position_data(position, accounts_service, clmm_repo)
+                    except Exception as e:
+                        logger.warning(f"Failed to refresh position {pos_detail['position_address']}: {e}")
+                        # Continue with other positions even if one fails
+
+            await asyncio.gather(*(refresh_one(pos_detail) for pos_detail in position_details))
 
         # Get final results after refresh
         async with db_manager.get_session_context() as session:
@@ -1440,6 +1533,7 @@ async def search_clmm_positions(
                 trading_pair=trading_pair,
                 status=status,
                 position_addresses=position_addresses,
+                pool_address=pool_address,
                 limit=limit,
                 offset=offset
             )
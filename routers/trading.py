@@ -202,6 +202,8 @@ async def get_active_orders(
 
         # Use filter request values
         accounts_to_check = filter_request.account_names if filter_request.account_names else list(all_connectors.keys())
+        # Set for O(1) per-order membership checks
+        trading_pairs_filter = set(filter_request.trading_pairs) if filter_request.trading_pairs else None
 
         for account_name in accounts_to_check:
             if account_name in all_connectors:
@@ -221,7 +223,7 @@ async def get_active_orders(
 
                             for client_order_id, order in in_flight_orders.items():
                                 # Apply trading pair filter if specified
-                                if filter_request.trading_pairs and order.trading_pair not in filter_request.trading_pairs:
+                                if trading_pairs_filter and order.trading_pair not in trading_pairs_filter:
                                     continue
 
                                 # Convert to standardized format to match orders search response
@@ -302,9 +304,11 @@ async def get_orders(
 
         # Apply filters for multiple values
         if filter_request.connector_names and len(filter_request.connector_names) > 1:
-            all_orders = [order for order in all_orders if order.get("connector_name") in filter_request.connector_names]
+            connector_names_filter = set(filter_request.connector_names)
+            all_orders = [order for order in all_orders if order.get("connector_name") in connector_names_filter]
         if filter_request.trading_pairs and len(filter_request.trading_pairs) > 1:
-            all_orders = [order for order in all_orders if order.get("trading_pair") in filter_request.trading_pairs]
+            trading_pairs_filter = set(filter_request.trading_pairs)
+            all_orders = [order for order in all_orders if order.get("trading_pair") in trading_pairs_filter]
 
         # Sort by timestamp (most recent first) then cursor_id, and apply cursor-based pagination
         return paginate_by_cursor(
@@ -382,11 +386,14 @@ async def get_trades(
 
         # Apply filters for multiple values
         if filter_request.connector_names and len(filter_request.connector_names) > 1:
-            all_trades = [trade for trade in all_trades if trade.get("connector_name") in filter_request.connector_names]
+            connector_names_filter = set(filter_request.connector_names)
+            all_trades = [trade for trade in all_trades if trade.get("connector_name") in connector_names_filter]
         if filter_request.trading_pairs and len(filter_request.trading_pairs) > 1:
-            all_trades = [trade for trade in all_trades if trade.get("trading_pair") in filter_request.trading_pairs]
+            trading_pairs_filter = set(filter_request.trading_pairs)
+            all_trades = [trade for trade in all_trades if trade.get("trading_pair") in trading_pairs_filter]
         if filter_request.trade_types and len(filter_request.trade_types) > 1:
-            all_trades = [trade for trade in all_trades if trade.get("trade_type") in filter_request.trade_types]
+            trade_types_filter = set(filter_request.trade_types)
+            all_trades = [trade for trade in all_trades if trade.get("trade_type") in trade_types_filter]
 
         # Sort by timestamp (most recent first) then cursor_id, and apply cursor-based pagination
         return paginate_by_cursor(
@@ -1,6 +1,8 @@
 import asyncio
 import logging
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
@@ -25,6 +27,9 @@ logger = logging.getLogger(__name__)
 # Safe single path component names: prevents path traversal via '/', '\' or '..'
 SAFE_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
 
+# Tokens excluded from account balances; settings are loaded once at startup, so build the set once
+BANNED_TOKENS = frozenset(settings.banned_tokens)
+
 
 def validate_safe_name(name: str, label: str = "name") -> str:
     """
@@ -67,6 +72,10 @@ class AccountsService:
         "architect_perpetual": "USD",
     }
     potential_wrapped_tokens = ["ETH", "SOL", "BNB", "POL", "AVAX"]
+    # Maximum trading pairs kept in the last-known price fallback cache
+    MAX_CACHED_PRICES = 4096
+    # Maximum concurrent per-pair last-traded-price requests to a single exchange
+    PRICE_FETCH_CONCURRENCY = 8
 
     def __init__(self,
                  db_manager: AsyncDatabaseManager,
@@ -91,13 +100,22 @@ class AccountsService:
         self.secrets_manager = ETHKeyFileSecretManger(settings.security.config_password)
         self.accounts_state = {}
         self.update_account_state_interval = account_update_interval * 60
+        # Bound each connector refresh so one hung exchange can't push the next cycle past its interval
+        self.connector_refresh_timeout = self.update_account_state_interval * 0.8
         self.order_status_poll_interval = 60  # Poll order status every 1 minute
         self.default_quote = default_quote
         self._update_account_state_task: Optional[asyncio.Task] = None
         self._order_status_polling_task: Optional[asyncio.Task] = None
+        # In-flight update_account_state runs keyed by their filters, so concurrent identical
+        # refresh requests share one exchange fan-out instead of each starting their own
+        self._account_state_updates: Dict[tuple, asyncio.Task] = {}
+        # Bumped whenever accounts or credentials change; part of the single-flight key so an update
+        # requested after a change never joins one that started before it
+        self._state_generation = 0
 
-        # Cache for storing last successful prices by trading pair (per-instance)
-        self._last_known_prices = {}
+        # Cache for storing last successful prices by trading pair (per-instance), bounded to
+        # MAX_CACHED_PRICES entries with least-recently-updated pairs evicted first
+        self._last_known_prices: "OrderedDict[str, Decimal]" = OrderedDict()
 
         # Database setup for account states and orders (shared manager injected from main.py;
         # tables are created once at startup so no per-service bootstrap is needed)
@@ -191,20 +209,32 @@ class AccountsService:
             self._order_status_polling_task = None
             logger.info("Stopped order status polling loop")
 
-        # Stop Gateway transaction poller
-        if self._gateway_poller_started:
-            try:
-                await self.gateway_tx_poller.stop()
-                logger.info("Gateway transaction poller stopped")
-                self._gateway_poller_started = False
-            except Exception as e:
-                logger.error(f"Error stopping Gateway transaction poller: {e}", exc_info=True)
+        # Stop the Gateway transaction poller and all connectors concurrently; they are
+        # independent, so shutdown takes the slower of the two rather than their sum
+        _, connectors_result = await asyncio.gather(
+            self._stop_gateway_poller(),
+            self._connector_service.stop_all(),
+            return_exceptions=True
+        )
+        if isinstance(connectors_result, Exception):
+            logger.error(f"Error stopping connectors: {connectors_result}", exc_info=connectors_result)
 
-        # Stop all connectors through the connector service
-        await self._connector_service.stop_all()
+        # Close the pooled Gateway HTTP session (after the poller, which uses it, has stopped)
+        await self.gateway_client.close()
 
         logger.info("AccountsService stopped successfully")
 
+    async def _stop_gateway_poller(self):
+        """Stop the Gateway transaction poller if it was started."""
+        if not self._gateway_poller_started:
+            return
+        try:
+            await self.gateway_tx_poller.stop()
+            logger.info("Gateway transaction poller stopped")
+            self._gateway_poller_started = False
+        except Exception as e:
+            logger.error(f"Error stopping Gateway transaction poller: {e}", exc_info=True)
+
     async def _refresh_and_get_tokens_info(self, connector, connector_name: str, account_name: str) -> List[Dict]:
         """Refresh connector state from exchange, then get token info with prices.
 
@@ -212,47 +242,59 @@ class AccountsService:
         single awaitable so both can run in parallel across all connectors.
         """
         try:
-            await self._connector_service.refresh_connector_state(connector, connector_name, account_name)
+            await asyncio.wait_for(
+                self._connector_service.refresh_connector_state(connector, connector_name, account_name),
+                timeout=self.connector_refresh_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out refreshing {connector_name} after {self.connector_refresh_timeout:.0f}s, using stale data")
         except Exception as e:
             logger.error(f"Error refreshing {connector_name}, using stale data: {e}")
         # skip_balance_refresh=True since refresh_connector_state already called _update_balances
         return await self._get_connector_tokens_info(connector, connector_name, skip_balance_refresh=True)
 
+    async def _store_tokens_info(self, tokens_info_coro, connector_name: str, account_name: str):
+        """Await a connector's token info and store it in accounts_state as soon as it completes.
+
+        Lets parallel updates publish each connector's balances without waiting for the slowest one.
+        Results for an account deleted while the refresh was in flight are dropped.
+        """
+        try:
+            tokens_info = await tokens_info_coro
+        except Exception as e:
+            logger.error(f"Error updating {connector_name} in {account_name}: {e}")
+            tokens_info = []
+        if account_name in self.accounts_state:
+            self.accounts_state[account_name][connector_name] = tokens_info
+
     async def update_account_state_loop(self):
         """
         The loop that updates the account state at a fixed interval.
         Performs connector state refresh + token info retrieval in a single parallel pass.
         """
         while True:
+            # Schedule against the cycle start so the cadence doesn't drift by the work time
+            next_run = time.monotonic() + self.update_account_state_interval
             try:
                 await self.check_all_connectors()
 
-                # Single parallel pass: refresh connector state + get token info + gateway
+                # Single parallel pass: refresh connector state + get token info + gateway.
+                # Each connector's result is written to accounts_state as soon as it arrives,
+                # so readers see fresh data without waiting for the slowest connector.
                 all_connectors = self._connector_service.get_all_trading_connectors()
                 tasks = []
-                task_meta = []  # (account_name, connector_name)
 
                 for account_name, connectors in all_connectors.items():
                     if account_name not in self.accounts_state:
                         self.accounts_state[account_name] = {}
                     for connector_name, connector in connectors.items():
-                        tasks.append(self._refresh_and_get_tokens_info(connector, connector_name, account_name))
-                        task_meta.append((account_name, connector_name))
-
-                has_connector_tasks = len(tasks) > 0
-                tasks.append(self._update_gateway_balances())
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Process connector results (last result is always gateway)
-                connector_results = results[:-1] if has_connector_tasks else []
-                for (account_name, connector_name), result in zip(task_meta, connector_results):
-                    if isinstance(result, Exception):
-                        logger.error(f"Error updating {connector_name} in {account_name}: {result}")
-                        self.accounts_state[account_name][connector_name] = []
-                    else:
-                        self.accounts_state[account_name][connector_name] = result
+                        tasks.append(self._store_tokens_info(
+                            self._refresh_and_get_tokens_info(connector, connector_name, account_name),
+                            connector_name, account_name
+                        ))
 
-                gw_result = results[-1]
+                gw_task = self._update_gateway_balances()
+                *_, gw_result = await asyncio.gather(*tasks, gw_task, return_exceptions=True)
                 if isinstance(gw_result, Exception):
                     logger.error(f"Error updating gateway balances: {gw_result}")
 
@@ -260,7 +302,7 @@ class AccountsService:
             except Exception as e:
                 logger.error(f"Error updating account state: {e}")
             finally:
-                await asyncio.sleep(self.update_account_state_interval)
+                await asyncio.sleep(max(0.0, next_run - time.monotonic()))
 
     async def order_status_polling_loop(self):
         """
@@ -270,19 +312,20 @@ class AccountsService:
         This loop just syncs that state to our database and cleans up closed orders.
         """
         while True:
+            next_run = time.monotonic() + self.order_status_poll_interval
             try:
                 await self._connector_service.sync_all_orders_to_database()
             except Exception as e:
                 logger.error(f"Error syncing order state to database: {e}")
             finally:
-                await asyncio.sleep(self.order_status_poll_interval)
+                await asyncio.sleep(max(0.0, next_run - time.monotonic()))
 
     async def dump_account_state(self):
         """
         Save the current account state to the database.
         All account/connector combinations from the same snapshot will use the same timestamp.
-        The whole snapshot is persisted atomically in a single transaction: save_account_state
-        only flushes, and get_session_context commits once on successful exit.
+        The whole snapshot is persisted atomically in a single transaction: save_account_states
+        flushes all rows in one batch, and get_session_context commits once on successful exit.
         :return:
         """
         # Snapshot the live dict synchronously (no awaits) so concurrent mutations of
@@ -295,14 +338,8 @@ class AccountsService:
 
             async with self.db_manager.get_session_context() as session:
                 repository = AccountRepository(session)
-
-                # Save each account-connector combination with the same timestamp.
-                # No commit happens inside the loop; the session context commits once
-                # after all rows are added (one transaction per snapshot).
-                for account_name, connectors in accounts_state_snapshot.items():
-                    for connector_name, tokens_info in connectors.items():
-                        if tokens_info:  # Only save if there's token data
-                            await repository.save_account_state(account_name, connector_name, tokens_info, snapshot_timestamp)
+                # All account-connector combinations are inserted in one batched flush
+                await repository.save_account_states(accounts_state_snapshot, snapshot_timestamp)
 
         except Exception as e:
             logger.error(f"Error saving account state to database: {e}")
@@ -349,9 +386,13 @@ class AccountsService:
         """
         Check all available credentials for all accounts and ensure connectors are initialized.
         This method is idempotent - it only initializes missing connectors.
+        Accounts are checked concurrently; connector creation is serialized per
+        account/connector by the connector service's locks.
         """
-        for account_name in self.list_accounts():
-            await self._ensure_account_connectors_initialized(account_name)
+        await asyncio.gather(*(
+            self._ensure_account_connectors_initialized(account_name)
+            for account_name in self.list_accounts()
+        ))
 
     async def _ensure_account_connectors_initialized(self, account_name: str):
         """
@@ -360,8 +401,7 @@ class AccountsService:
 
         :param account_name: The name of the account to initialize connectors for.
         """
-        # Initialize missing connectors
-        for connector_name in self._connector_service.list_available_credentials(account_name):
+        async def initialize(connector_name: str):
             try:
                 # Only initialize if connector doesn't exist
                 if not self._connector_service.is_trading_connector_initialized(account_name, connector_name):
@@ -370,6 +410,12 @@ class AccountsService:
             except Exception as e:
                 logger.error(f"Error initializing connector {connector_name} for account {account_name}: {e}")
 
+        # Initialize missing connectors concurrently
+        await asyncio.gather(*(
+            initialize(connector_name)
+            for connector_name in self._connector_service.list_available_credentials(account_name)
+        ))
+
     async def update_account_state(
         self,
         skip_gateway: bool = False,
@@ -383,12 +429,30 @@ class AccountsService:
             account_names: If provided, only update these accounts. If None, update all accounts.
             connector_names: If provided, only update these connectors. If None, update all connectors.
                             For Gateway, this filters by chain-network (e.g., 'solana-mainnet-beta').
+
+        Concurrent calls with the same filters join the update already in flight, unless accounts or
+        credentials changed since it started.
         """
+        key = (self._state_generation, skip_gateway, frozenset(account_names or ()), frozenset(connector_names or ()))
+        task = self._account_state_updates.get(key)
+        if task is None:
+            task = asyncio.create_task(self._update_account_state(skip_gateway, account_names, connector_names))
+            self._account_state_updates[key] = task
+            task.add_done_callback(lambda _: self._account_state_updates.pop(key, None))
+        # Shield so a cancelled caller doesn't cancel the update other callers are waiting on
+        await asyncio.shield(task)
+
+    async def _update_account_state(
+        self,
+        skip_gateway: bool,
+        account_names: Optional[List[str]],
+        connector_names: Optional[List[str]]
+    ):
+        """Run a single filtered account state update (see update_account_state)."""
         all_connectors = self._connector_service.get_all_trading_connectors()
 
-        # Prepare parallel tasks
+        # Prepare parallel tasks; each stores its connector's result as soon as it completes
         tasks = []
-        task_meta = []  # (account_name, connector_name)
 
         for account_name, connectors in all_connectors.items():
             # Filter by account_names if specified
@@ -402,29 +466,17 @@ class AccountsService:
                 if connector_names and connector_name not in connector_names:
                     continue
 
-                tasks.append(self._get_connector_tokens_info(connector, connector_name))
-                task_meta.append((account_name, connector_name))
+                tasks.append(self._store_tokens_info(
+                    self._get_connector_tokens_info(connector, connector_name),
+                    connector_name, account_name
+                ))
 
         # Execute connectors + gateway in parallel (unless skip_gateway is True)
-        if skip_gateway:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-        else:
+        if not skip_gateway:
             # Pass connector_names filter to gateway for chain-network filtering
-            results = await asyncio.gather(
-                *tasks,
-                self._update_gateway_balances(chain_networks=connector_names),
-                return_exceptions=True
-            )
-            # Remove gateway result from processing (it handles its own state internally)
-            results = results[:-1]
-
-        # Process results
-        for (account_name, connector_name), result in zip(task_meta, results):
-            if isinstance(result, Exception):
-                logger.error(f"Error updating balances for connector {connector_name} in account {account_name}: {result}")
-                self.accounts_state[account_name][connector_name] = []
-            else:
-                self.accounts_state[account_name][connector_name] = result
+            # (it handles its own state internally)
+            tasks.append(self._update_gateway_balances(chain_networks=connector_names))
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _get_connector_tokens_info(self, connector, connector_name: str, skip_balance_refresh: bool = False) -> List[Dict]:
         """Get token info from a connector instance using RateOracle cached prices.
@@ -445,7 +497,7 @@ class AccountsService:
                 logger.warning(f"Failed to refresh balances for {connector_name}, using cached data: {e}")
 
         balances = [{"token": key, "units": value} for key, value in connector.get_all_balances().items() if
-                    value != Decimal("0") and key not in settings.banned_tokens]
+                    value != 0 and key not in BANNED_TOKENS]
 
         tokens_info = []
         missing_pairs = []  # trading pairs the oracle can't price
@@ -477,38 +529,50 @@ class AccountsService:
         # Batch-fetch only the missing prices from the exchange
         if missing_pairs:
             fallback_prices = await self._safe_get_last_traded_prices(connector, missing_pairs)
-            for pair_idx, info_idx in enumerate(missing_indices):
-                market = missing_pairs[pair_idx]
+            for market, info_idx in zip(missing_pairs, missing_indices):
                 price = Decimal(str(fallback_prices.get(market, 0)))
+                # tokens_info is built one entry per balance, so the same index holds the exact
+                # Decimal units (avoids re-parsing the float already stored in tokens_info)
                 tokens_info[info_idx]["price"] = float(price)
-                tokens_info[info_idx]["value"] = float(price * Decimal(str(tokens_info[info_idx]["units"])))
+                tokens_info[info_idx]["value"] = float(price * balances[info_idx]["units"])
 
         return tokens_info
     
     async def _safe_get_last_traded_prices(self, connector, trading_pairs, timeout=10):
         """Safely get last traded prices with timeout and error handling.
-        Fetches each pair individually via gather so one bad pair doesn't kill the rest."""
+        Fetches each pair individually so one bad pair doesn't kill the rest, with at
+        most PRICE_FETCH_CONCURRENCY requests in flight to stay within exchange rate limits.
+        On timeout only the pairs still pending fall back to cached prices; prices that
+        already arrived are kept."""
+        if not trading_pairs:
+            return {}
+
+        semaphore = asyncio.Semaphore(self.PRICE_FETCH_CONCURRENCY)
 
         async def _fetch_single(pair):
-            return pair, await connector._get_last_traded_price(trading_pair=pair)
+            async with semaphore:
+                return pair, await connector._get_last_traded_price(trading_pair=pair)
 
+        tasks = [asyncio.create_task(_fetch_single(p)) for p in trading_pairs]
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*[_fetch_single(p) for p in trading_pairs], return_exceptions=True),
-                timeout=timeout,
-            )
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout getting last traded prices for trading pairs {trading_pairs}")
-            return self._get_fallback_prices(trading_pairs)
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            # Also covers the caller being cancelled mid-wait: never leave requests running
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        if pending:
+            logger.error(f"Timeout getting last traded prices for {len(pending)} of {len(trading_pairs)} "
+                         f"trading pairs {trading_pairs}")
 
         last_traded = {}
-        for result in results:
-            if isinstance(result, Exception):
-                logger.warning(f"Failed to get price for a pair: {result}")
+        for task in done:
+            if task.exception() is not None:
+                logger.warning(f"Failed to get price for a pair: {task.exception()}")
                 continue
-            pair, price = result
+            pair, price = task.result()
             if price and price > 0:
-                self._last_known_prices[pair] = price
+                self._remember_price(pair, price)
             last_traded[pair] = price
 
         # Fill in fallbacks for any pairs that failed
@@ -517,6 +581,13 @@ class AccountsService:
 
         return last_traded
     
+    def _remember_price(self, pair: str, price: Decimal):
+        """Record the last successful price for a pair, evicting the stalest entry when full."""
+        self._last_known_prices[pair] = price
+        self._last_known_prices.move_to_end(pair)
+        if len(self._last_known_prices) > self.MAX_CACHED_PRICES:
+            self._last_known_prices.popitem(last=False)
+
     def _get_fallback_prices(self, trading_pairs):
         """Get fallback prices using cached values, only setting to 0 if no previous price exists."""
         fallback_prices = {}
@@ -560,6 +631,7 @@ class AccountsService:
         try:
             # Update the connector keys (this saves the credentials to file and validates them)
             connector = await self._connector_service.update_connector_keys(account_name, connector_name, credentials)
+            self._state_generation += 1
 
             await self.update_account_state()
         except Exception as e:
@@ -608,6 +680,8 @@ class AccountsService:
         if fs_util.path_exists(f"credentials/{account_name}/connectors/{connector_name}.yml"):
             fs_util.delete_file(directory=f"credentials/{account_name}/connectors", file_name=f"{connector_name}.yml")
 
+        self._state_generation += 1
+
         # Always perform cleanup regardless of file existence
         # Stop the connector if it's running
         await self._connector_service.stop_trading_connector(account_name, connector_name)
@@ -637,6 +711,7 @@ class AccountsService:
         
         # Initialize account state
         self.accounts_state[account_name] = {}
+        self._state_generation += 1
 
     async def delete_account(self, account_name: str):
         """
@@ -645,14 +720,16 @@ class AccountsService:
         :return:
         """
         validate_safe_name(account_name, "account name")
+        self._state_generation += 1
         # Stop all connectors for this account
         for connector_name in self._connector_service.list_account_connectors(account_name):
             await self._connector_service.stop_trading_connector(account_name, connector_name)
         # Clear all connectors for this account from cache
         self._connector_service.clear_trading_connector(account_name)
 
-        # Delete account folder
-        fs_util.delete_folder('credentials', account_name)
+        # Delete account folder off the event loop (recursive delete of all credential files)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, fs_util.delete_folder, 'credentials', account_name)
 
         # Remove from account state
         if account_name in self.accounts_state:
@@ -1038,6 +1115,14 @@ class AccountsService:
                            (e.g., ['solana-mainnet-beta', 'ethereum-mainnet']).
                            If None, update all defaultNetworks for each chain.
         """
+        requested_chains = None
+        if chain_networks:
+            # Chain-network ids are '<chain>-<network>'; plain CEX connector names have no chain part
+            requested_chains = {chain_network.split("-", 1)[0] for chain_network in chain_networks if "-" in chain_network}
+            if not requested_chains:
+                # The filter only names exchange connectors, so there is nothing to query on Gateway
+                return
+
         try:
             # Check if Gateway is available
             if not await self.gateway_client.ping():
@@ -1064,8 +1149,10 @@ class AccountsService:
             # per chain in serial. Each config is the merged chain-network namespace
             # (e.g., solana-mainnet-beta), returning both chain-level fields
             # (defaultWallet, defaultNetworks) and network fields.
+            # (Chains outside a chain_networks filter are skipped without fetching their config.)
             chains_with_networks = [
-                chain_info for chain_info in chains_result["chains"] if chain_info.get("networks")
+                chain_info for chain_info in chains_result["chains"]
+                if chain_info.get("networks") and (requested_chains is None or chain_info["chain"] in requested_chains)
             ]
             for chain_info in chains_result["chains"]:
                 if not chain_info.get("networks"):
@@ -41,6 +41,7 @@ class DockerService:
         try:
             all_containers = self.client.containers.list(filters={"status": "running"})
             if name_filter:
+                name_filter_lower = name_filter.lower()
                 containers_info = [
                     {
                         "id": container.id,
@@ -48,7 +49,7 @@ class DockerService:
                         "status": container.status,
                         "image": container.image.tags[0] if container.image.tags else container.image.id[:12]
                     }
-                    for container in all_containers if name_filter.lower() in container.name.lower()
+                    for container in all_containers if name_filter_lower in container.name.lower()
                 ]
             else:
                 containers_info = [
@@ -89,6 +90,7 @@ class DockerService:
         try:
             all_containers = self.client.containers.list(filters={"status": "exited"}, all=True)
             if name_filter:
+                name_filter_lower = name_filter.lower()
                 containers_info = [
                     {
                         "id": container.id,
@@ -96,7 +98,7 @@ class DockerService:
                         "status": container.status,
                         "image": container.image.tags[0] if container.image.tags else container.image.id[:12]
                     }
-                    for container in all_containers if name_filter.lower() in container.name.lower()
+                    for container in all_containers if name_filter_lower in container.name.lower()
                 ]
             else:
                 containers_info = [
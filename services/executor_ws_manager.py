@@ -68,8 +68,8 @@ class ExecutorSubscription:
 
 
 def _compute_hash(data: Any) -> str:
-    """MD5 hash of JSON-serialized data for change detection."""
-    raw = json.dumps(data, sort_keys=True, default=str)
+    """MD5 hash of compact JSON-serialized data for change detection."""
+    raw = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
     return hashlib.md5(raw.encode()).hexdigest()
 
 
@@ -1,9 +1,29 @@
+import copy
+import json
 import logging
 import ssl
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from functools import partial
 from typing import Any, Callable, Dict, List, Optional
 
 import aiohttp
 
+try:
+    # Optional faster JSON encoder/decoder for Gateway payloads (pools, positions)
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
+# Decoder for price/amount responses: JSON numbers become Decimal without a lossy float round-trip
+_json_loads_decimal = partial(json.loads, parse_float=Decimal)
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +56,21 @@ class GatewayClient:
         # while the Gateway is simply not started. Logged once on the transition, then suppressed
         # until certs become available again.
         self._certs_unavailable_warned = False
+        # Short-lived cache of CLMM pool-info responses keyed by (connector, network, pool_address).
+        # Lets back-to-back callers (e.g. a pool-info lookup followed by an open) reuse a freshly
+        # observed price instead of issuing another Gateway RPC.
+        # Ordered by insertion time, so expired entries are always at the front.
+        self._pool_info_cache: "OrderedDict[tuple, tuple[float, Dict]]" = OrderedDict()
+
+    # Seconds a cached CLMM pool-info response is considered fresh
+    POOL_INFO_FRESHNESS_SECONDS = 5.0
+    # Maximum cached CLMM pool-info responses (oldest evicted first)
+    MAX_POOL_INFO_CACHE_ENTRIES = 256
+    # Seconds an idle pooled connection to Gateway is kept open for reuse
+    KEEPALIVE_TIMEOUT_SECONDS = 60.0
+    # Maximum concurrent connections to Gateway (aiohttp's default of 100 lets concurrent
+    # fan-outs open far more sockets than a single local Gateway can usefully serve)
+    MAX_CONNECTIONS = 20
 
     @staticmethod
     def parse_network_id(network_id: str) -> tuple[str, str]:
@@ -82,11 +117,14 @@ class GatewayClient:
         """Get or create aiohttp session"""
         if self._session is None or self._session.closed:
             ssl_context = self._get_ssl_context()
-            if ssl_context is not None:
-                connector = aiohttp.TCPConnector(ssl=ssl_context)
-                self._session = aiohttp.ClientSession(connector=connector)
-            else:
-                self._session = aiohttp.ClientSession()
+            # Keep idle connections alive across poll cycles (positions/transactions poll every
+            # 10s) so requests reuse an open socket instead of reconnecting (and re-handshaking TLS)
+            connector = aiohttp.TCPConnector(
+                ssl=ssl_context if ssl_context is not None else True,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT_SECONDS,
+                limit=self.MAX_CONNECTIONS
+            )
+            self._session = aiohttp.ClientSession(connector=connector, json_serialize=_json_dumps)
         return self._session
 
     async def close(self):
@@ -94,8 +132,15 @@ class GatewayClient:
         if self._session and not self._session.closed:
             await self._session.close()
 
-    async def _request(self, method: str, path: str, params: Dict = None, json: Dict = None) -> Optional[Dict]:
-        """Make HTTP request to Gateway"""
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Dict = None,
+        json: Dict = None,
+        parse_decimal: bool = False
+    ) -> Optional[Dict]:
+        """Make HTTP request to Gateway. With parse_decimal, JSON floats are decoded as Decimal."""
         url = f"{self.base_url}/{path}"
 
         try:
@@ -114,26 +159,22 @@ class GatewayClient:
 
         try:
             if method == "GET":
-                async with session.get(url, params=params) as response:
-                    if not response.ok:
-                        error_body = await self._get_error_body(response)
-                        logger.warning(f"Gateway request failed: {method} {url} - {response.status} - {error_body}")
-                        return {"error": error_body, "status": response.status}
-                    return await response.json()
+                for attempt in range(2):
+                    try:
+                        async with session.get(url, params=params) as response:
+                            return await self._read_response(method, url, response, parse_decimal)
+                    except aiohttp.ServerDisconnectedError:
+                        # A pooled keep-alive connection was closed by Gateway while idle. GETs are
+                        # idempotent, so retry once on a fresh connection before reporting an error.
+                        if attempt:
+                            raise
+                        logger.debug(f"Gateway closed pooled connection, retrying: {method} {url}")
             elif method == "POST":
                 async with session.post(url, params=params, json=json) as response:
-                    if not response.ok:
-                        error_body = await self._get_error_body(response)
-                        logger.warning(f"Gateway request failed: {method} {url} - {response.status} - {error_body}")
-                        return {"error": error_body, "status": response.status}
-                    return await response.json()
+                    return await self._read_response(method, url, response, parse_decimal)
             elif method == "DELETE":
                 async with session.delete(url, params=params, json=json) as response:
-                    if not response.ok:
-                        error_body = await self._get_error_body(response)
-                        logger.warning(f"Gateway request failed: {method} {url} - {response.status} - {error_body}")
-                        return {"error": error_body, "status": response.status}
-                    return await response.json()
+                    return await self._read_response(method, url, response, parse_decimal)
         except aiohttp.ClientError as e:
             logger.debug(f"Gateway request error: {method} {url} - {e}")
             return None
@@ -141,6 +182,20 @@ class GatewayClient:
             logger.debug(f"Gateway request failed: {method} {url} - {e}")
             raise
 
+    async def _read_response(
+        self,
+        method: str,
+        url: str,
+        response: aiohttp.ClientResponse,
+        parse_decimal: bool = False
+    ) -> Dict:
+        """Return the JSON body of a Gateway response, or an error dict for non-2xx statuses"""
+        if not response.ok:
+            error_body = await self._get_error_body(response)
+            logger.warning(f"Gateway request failed: {method} {url} - {response.status} - {error_body}")
+            return {"error": error_body, "status": response.status}
+        return await response.json(loads=_json_loads_decimal if parse_decimal else _json_loads)
+
     async def _get_error_body(self, response: aiohttp.ClientResponse) -> str:
         """Extract error message from response body"""
         try:
@@ -496,7 +551,12 @@ class GatewayClient:
         if extra_params:
             payload.update(extra_params)
 
-        return await self._request("POST", f"connectors/{connector}/clmm/open-position", json=payload)
+        # Liquidity in the pool changes with the open, so the next pool-info read must hit Gateway.
+        # Invalidate after the POST so a concurrent read can't re-cache pre-open state.
+        try:
+            return await self._request("POST", f"connectors/{connector}/clmm/open-position", json=payload)
+        finally:
+            self.clear_pool_info_cache(pool_address)
 
     async def clmm_add_liquidity(
         self,
@@ -522,7 +582,10 @@ class GatewayClient:
         if slippage_pct is not None:
             payload["slippagePct"] = slippage_pct
 
-        return await self._request("POST", "clmm/liquidity/add", json=payload)
+        try:
+            return await self._request("POST", "clmm/liquidity/add", json=payload)
+        finally:
+            self.clear_pool_info_cache()
 
     async def clmm_close_position(
         self,
@@ -532,11 +595,14 @@ class GatewayClient:
         position_address: str
     ) -> Dict:
         """Close a CLMM position completely"""
-        return await self._request("POST", f"connectors/{connector}/clmm/close-position", json={
-            "network": network,
-            "walletAddress": wallet_address,
-            "positionAddress": position_address
-        })
+        try:
+            return await self._request("POST", f"connectors/{connector}/clmm/close-position", json={
+                "network": network,
+                "walletAddress": wallet_address,
+                "positionAddress": position_address
+            })
+        finally:
+            self.clear_pool_info_cache()
 
     async def clmm_remove_liquidity(
         self,
@@ -547,13 +613,16 @@ class GatewayClient:
         percentage: float
     ) -> Dict:
         """Remove liquidity from a CLMM position (partial)"""
-        return await self._request("POST", "clmm/liquidity/remove", json={
-            "connector": connector,
-            "network": network,
-            "address": wallet_address,
-            "positionAddress": position_address,
-            "percentage": percentage
-        })
+        try:
+            return await self._request("POST", "clmm/liquidity/remove", json={
+                "connector": connector,
+                "network": network,
+                "address": wallet_address,
+                "positionAddress": position_address,
+                "percentage": percentage
+            })
+        finally:
+            self.clear_pool_info_cache()
 
     async def clmm_position_info(
         self,
@@ -566,6 +635,7 @@ class GatewayClient:
 
         Note: Gateway returns 500 instead of 404 when position doesn't exist (is closed).
         Callers should treat 500 errors as "position not found/closed".
+        Prices and amounts in the response are decoded as Decimal.
         """
         # Validate required parameters
         if not connector:
@@ -580,7 +650,7 @@ class GatewayClient:
             "chainNetwork": chain_network,
             "positionAddress": position_address
         }
-        return await self._request("GET", "trading/clmm/position-info", params=params)
+        return await self._request("GET", "trading/clmm/position-info", params=params, parse_decimal=True)
 
     async def clmm_positions_owned(
         self,
@@ -639,13 +709,75 @@ class GatewayClient:
         self,
         connector: str,
         network: str,
-        pool_address: str
+        pool_address: str,
+        use_cache: bool = True
     ) -> Dict:
-        """Get detailed CLMM pool information by pool address"""
-        return await self._request("GET", f"connectors/{connector}/clmm/pool-info", params={
+        """Get detailed CLMM pool information by pool address.
+
+        Prices and amounts in the response are decoded as Decimal. Successful responses are
+        reused for ``POOL_INFO_FRESHNESS_SECONDS`` so that a price fetched moments ago is not
+        requested again. With ``use_cache=False`` Gateway is always queried, and the fresh
+        response still refreshes the cache. Callers get their own copy and may mutate it.
+        """
+        cache_key = (connector, network, pool_address)
+        self._evict_expired_pool_info()
+        cached = self._pool_info_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            return copy.deepcopy(cached[1])
+
+        result = await self._request("GET", f"connectors/{connector}/clmm/pool-info", params={
             "network": network,
             "poolAddress": pool_address
-        })
+        }, parse_decimal=True)
+        if isinstance(result, dict) and "error" not in result:
+            self._pool_info_cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
+            self._pool_info_cache.move_to_end(cache_key)
+            while len(self._pool_info_cache) > self.MAX_POOL_INFO_CACHE_ENTRIES:
+                self._pool_info_cache.popitem(last=False)
+        return result
+
+    def _evict_expired_pool_info(self):
+        """Drop cached pool-info responses older than POOL_INFO_FRESHNESS_SECONDS."""
+        now = time.monotonic()
+        while self._pool_info_cache:
+            fetched_at, _ = next(iter(self._pool_info_cache.values()))
+            if now - fetched_at < self.POOL_INFO_FRESHNESS_SECONDS:
+                break
+            self._pool_info_cache.popitem(last=False)
+
+    async def clmm_fetch_pools(
+        self,
+        connector: str,
+        network: str,
+        page: int = 0,
+        limit: int = 50,
+        query: Optional[str] = None,
+        sort_by: Optional[str] = None,
+        include_unverified: bool = True
+    ) -> Optional[Dict]:
+        """List CLMM pools for a connector via Gateway's fetch-pools endpoint"""
+        params = {
+            "network": network,
+            "limit": limit,
+        }
+        if page > 0:
+            params["page"] = page
+        if query:
+            params["query"] = query
+        if sort_by:
+            params["sortBy"] = sort_by
+        if not include_unverified:
+            params["includeUnverified"] = "false"
+
+        return await self._request("GET", f"connectors/{connector}/clmm/fetch-pools", params=params)
+
+    def clear_pool_info_cache(self, pool_address: Optional[str] = None):
+        """Drop cached CLMM pool info for one pool, or for all pools if no address is given."""
+        if pool_address is None:
+            self._pool_info_cache.clear()
+            return
+        for cache_key in [key for key in self._pool_info_cache if key[2] == pool_address]:
+            del self._pool_info_cache[cache_key]
 
     # ============================================
     # Transaction Polling
@@ -10,7 +10,7 @@ import asyncio
 import logging
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 from database import AsyncDatabaseManager
 from database.models import GatewayCLMMPosition
@@ -19,6 +19,10 @@ from services.gateway_client import GatewayClient
 
 logger = logging.getLogger(__name__)
 
+# Default for _refresh_position_state's position_info: distinguishes "not prefetched" from a
+# prefetched None (Gateway connection error)
+_NOT_PREFETCHED = object()
+
 
 class GatewayTransactionPoller:
     """
@@ -31,6 +35,9 @@ class GatewayTransactionPoller:
     need to be polled until they are confirmed on-chain or fail.
     """
 
+    # Initial (shortest) transaction poll interval in seconds while transactions are pending
+    MIN_POLL_INTERVAL = 1.0
+
     def __init__(
         self,
         db_manager: AsyncDatabaseManager,
@@ -86,21 +93,58 @@ class GatewayTransactionPoller:
         logger.info("GatewayTransactionPoller stopped")
 
     async def _poll_loop(self):
-        """Main polling loop."""
+        """
+        Main polling loop.
+
+        When a transaction hash not seen by the previous poll is pending, the interval drops to
+        MIN_POLL_INTERVAL and then doubles up to poll_interval, so fresh transactions are
+        confirmed quickly without hammering Gateway for slow ones. With nothing pending it polls every poll_interval.
+        """
+        delay = self.poll_interval
+        previous_pending_hashes: Set[str] = set()
         while self._running:
+            pending_hashes: Set[str] = set()
             try:
-                await self._poll_pending_transactions()
+                pending_hashes = await self._poll_pending_transactions()
             except Exception as e:
                 logger.error(f"Error in poll loop: {e}", exc_info=True)
 
+            delay = self._next_poll_interval(delay, pending_hashes, previous_pending_hashes)
+            previous_pending_hashes = pending_hashes
+
             # Wait before next poll
             try:
-                await asyncio.sleep(self.poll_interval)
+                await asyncio.sleep(delay)
             except asyncio.CancelledError:
                 break
 
-    async def _poll_pending_transactions(self):
-        """Poll all pending transactions and update their status."""
+    def _next_poll_interval(self, delay: float, pending_hashes: Set[str], previous_pending_hashes: Set[str]) -> float:
+        """
+        Compute the delay before the next transaction poll.
+
+        Args:
+            delay: Delay used before the poll that just ran
+            pending_hashes: Hashes of pending transactions found by that poll
+            previous_pending_hashes: Hashes of pending transactions found by the poll before it
+
+        Returns:
+            Seconds to sleep before polling again
+        """
+        if not pending_hashes:
+            return self.poll_interval
+        if not pending_hashes <= previous_pending_hashes:
+            # New transactions appeared (even if others confirmed): restart from the shortest interval
+            return min(self.MIN_POLL_INTERVAL, self.poll_interval)
+        return min(delay * 2, self.poll_interval)
+
+    async def _poll_pending_transactions(self) -> Set[str]:
+        """
+        Poll all pending transactions and update their status.
+
+        Returns:
+            Transaction hashes of the pending swaps and CLMM events found at the start of this poll
+        """
+        pending_hashes: Set[str] = set()
         try:
             async with self.db_manager.get_session_context() as session:
                 swap_repo = GatewaySwapRepository(session)
@@ -108,6 +152,7 @@ class GatewayTransactionPoller:
 
                 # Get pending swaps
                 pending_swaps = await swap_repo.get_pending_swaps(limit=100)
+                pending_hashes.update(swap.transaction_hash for swap in pending_swaps)
                 logger.debug(f"Found {len(pending_swaps)} pending swaps")
 
                 for swap in pending_swaps:
@@ -127,6 +172,7 @@ class GatewayTransactionPoller:
 
                 # Get pending CLMM events
                 pending_events = await clmm_repo.get_pending_events(limit=100)
+                pending_hashes.update(event.transaction_hash for event in pending_events)
                 logger.debug(f"Found {len(pending_events)} pending CLMM events")
 
                 for event in pending_events:
@@ -147,6 +193,8 @@ class GatewayTransactionPoller:
         except Exception as e:
             logger.error(f"Error polling pending transactions: {e}", exc_info=True)
 
+        return pending_hashes
+
     async def _poll_swap_transaction(self, swap, swap_repo: GatewaySwapRepository):
         """Poll a specific swap transaction status."""
         try:
@@ -299,7 +347,7 @@ class GatewayTransactionPoller:
                 logger.warning(f"Invalid response from Gateway for transaction {tx_hash} on {network_id}: {result}")
                 return None
 
-            logger.debug(f"Polled transaction {tx_hash} on {network_id}: txStatus={result.get('txStatus')}")
+            logger.debug("Polled transaction %s on %s: txStatus=%s", tx_hash, network_id, result.get("txStatus"))
 
             # Parse the response with defensive checks
             tx_status = result.get("txStatus")
@@ -378,6 +426,9 @@ class GatewayTransactionPoller:
         # {"connector": "uniswap", "chain": "ethereum", "network": "mainnet"},
     ]
 
+    # Max concurrent position-info requests to Gateway while refreshing open positions
+    POSITION_FETCH_CONCURRENCY = 5
+
     async def _position_poll_loop(self):
         """Position state polling loop (runs less frequently)."""
         while self._running:
@@ -453,74 +504,77 @@ class GatewayTransactionPoller:
                 # Get CLOSED positions (to potentially reopen if still on-chain)
                 closed_positions = await clmm_repo.get_position_addresses_set(status="CLOSED")
 
-            # Poll each supported connector/chain/wallet combination
-            for config in self.SUPPORTED_CLMM_CONFIGS:
-                connector = config["connector"]
-                chain = config["chain"]
-                network = config["network"]
+            # Fetch positions for every supported connector/chain/wallet combination concurrently
+            targets = [
+                (config["connector"], config["chain"], config["network"], wallet_address)
+                for config in self.SUPPORTED_CLMM_CONFIGS
+                for wallet_address in wallet_addresses_by_chain.get(config["chain"], [])
+            ]
+            results = await asyncio.gather(
+                *(
+                    self.gateway_client.clmm_positions_owned(
+                        connector=connector,
+                        chain_network=f"{chain}-{network}",
+                        wallet_address=wallet_address,
+                        pool_address=None  # Get all positions across all pools
+                    )
+                    for connector, chain, network, wallet_address in targets
+                ),
+                return_exceptions=True
+            )
 
-                # Get wallet addresses for this chain
-                wallet_addresses = wallet_addresses_by_chain.get(chain, [])
-                if not wallet_addresses:
-                    continue
+            # Process results sequentially so the open/closed bookkeeping stays consistent
+            for (connector, chain, network, wallet_address), gateway_positions in zip(targets, results):
+                try:
+                    if isinstance(gateway_positions, Exception):
+                        raise gateway_positions
 
-                for wallet_address in wallet_addresses:
-                    try:
-                        # Fetch ALL positions for this wallet (no pool filter)
-                        chain_network = f"{chain}-{network}"
-                        gateway_positions = await self.gateway_client.clmm_positions_owned(
-                            connector=connector,
-                            chain_network=chain_network,
-                            wallet_address=wallet_address,
-                            pool_address=None  # Get all positions across all pools
-                        )
+                    if not gateway_positions or not isinstance(gateway_positions, list):
+                        continue
 
-                        if not gateway_positions or not isinstance(gateway_positions, list):
+                    # Process each position
+                    for pos_data in gateway_positions:
+                        position_address = pos_data.get("address")
+                        if not position_address:
                             continue
 
-                        # Process each position
-                        for pos_data in gateway_positions:
-                            position_address = pos_data.get("address")
-                            if not position_address:
-                                continue
-
-                            # Skip if already tracked as OPEN
-                            if position_address in open_positions:
-                                continue
-
-                            # Check if position was incorrectly marked as CLOSED
-                            if position_address in closed_positions:
-                                # Position exists on-chain but is CLOSED in DB → reopen it
-                                async with self.db_manager.get_session_context() as session:
-                                    clmm_repo = GatewayCLMMRepository(session)
-                                    reopened = await clmm_repo.reopen_position(position_address)
-                                    if reopened:
-                                        reopened_count += 1
-                                        # Move from closed to open set for this run
-                                        closed_positions.discard(position_address)
-                                        open_positions.add(position_address)
-                                        logger.warning(f"Reopened position {position_address} - "
-                                                      f"was CLOSED in DB but still exists on-chain")
-                                continue
-
-                            # Create new position in database
-                            new_position = await self._create_discovered_position(
-                                pos_data=pos_data,
-                                connector=connector,
-                                chain=chain,
-                                network=network,
-                                wallet_address=wallet_address
-                            )
-
-                            if new_position:
-                                discovered_count += 1
-                                open_positions.add(position_address)
-                                logger.info(f"Discovered new position: {position_address} "
-                                           f"(pool: {pos_data.get('poolAddress', 'unknown')[:16]}...)")
+                        # Skip if already tracked as OPEN
+                        if position_address in open_positions:
+                            continue
 
-                    except Exception as e:
-                        logger.warning(f"Error discovering positions for {connector}/{chain}/{wallet_address}: {e}")
-                        continue
+                        # Check if position was incorrectly marked as CLOSED
+                        if position_address in closed_positions:
+                            # Position exists on-chain but is CLOSED in DB → reopen it
+                            async with self.db_manager.get_session_context() as session:
+                                clmm_repo = GatewayCLMMRepository(session)
+                                reopened = await clmm_repo.reopen_position(position_address)
+                                if reopened:
+                                    reopened_count += 1
+                                    # Move from closed to open set for this run
+                                    closed_positions.discard(position_address)
+                                    open_positions.add(position_address)
+                                    logger.warning(f"Reopened position {position_address} - "
+                                                   f"was CLOSED in DB but still exists on-chain")
+                            continue
+
+                        # Create new position in database
+                        new_position = await self._create_discovered_position(
+                            pos_data=pos_data,
+                            connector=connector,
+                            chain=chain,
+                            network=network,
+                            wallet_address=wallet_address
+                        )
+
+                        if new_position:
+                            discovered_count += 1
+                            open_positions.add(position_address)
+                            logger.info(f"Discovered new position: {position_address} "
+                                        f"(pool: {pos_data.get('poolAddress', 'unknown')[:16]}...)")
+
+                except Exception as e:
+                    logger.warning(f"Error discovering positions for {connector}/{chain}/{wallet_address}: {e}")
+                    continue
 
         except Exception as e:
             logger.error(f"Error in position discovery: {e}", exc_info=True)
@@ -657,10 +711,31 @@ class GatewayTransactionPoller:
 
                 logger.info(f"Updating {len(open_positions)} open CLMM positions")
 
+                # Fetch position info from Gateway concurrently (bounded), then apply the updates
+                # sequentially since the session must not be used concurrently
+                semaphore = asyncio.Semaphore(self.POSITION_FETCH_CONCURRENCY)
+
+                async def fetch_position_info(position: GatewayCLMMPosition):
+                    if not (position.position_address and position.wallet_address
+                            and position.connector and position.network):
+                        # Skipped and reported by _refresh_position_state's validation
+                        return _NOT_PREFETCHED
+                    async with semaphore:
+                        return await self.gateway_client.clmm_position_info(
+                            connector=position.connector,
+                            chain_network=position.network,
+                            position_address=position.position_address
+                        )
+
+                position_infos = await asyncio.gather(
+                    *(fetch_position_info(position) for position in open_positions),
+                    return_exceptions=True
+                )
+
                 # Update each position within the same session
-                for position in open_positions:
+                for position, position_info in zip(open_positions, position_infos):
                     try:
-                        await self._refresh_position_state(position, clmm_repo)
+                        await self._refresh_position_state(position, clmm_repo, position_info=position_info)
                     except Exception as e:
                         logger.warning(f"Failed to update position {position.position_address}: {e}")
                         continue
@@ -673,7 +748,12 @@ class GatewayTransactionPoller:
         """Poll all open CLMM positions and update their state. (Legacy wrapper)"""
         await self._poll_and_discover_positions()
 
-    async def _refresh_position_state(self, position: GatewayCLMMPosition, clmm_repo: GatewayCLMMRepository):
+    async def _refresh_position_state(
+        self,
+        position: GatewayCLMMPosition,
+        clmm_repo: GatewayCLMMRepository,
+        position_info: Any = _NOT_PREFETCHED
+    ):
         """
         Refresh a single position's state from Gateway.
 
@@ -682,6 +762,12 @@ class GatewayTransactionPoller:
         - liquidity amounts
         - pending fees
         - position status (if closed externally)
+
+        Args:
+            position: Position to refresh
+            clmm_repo: Repository bound to the caller's session
+            position_info: Prefetched Gateway position-info response (None on a Gateway connection
+                error, or the exception raised while fetching it). Fetched here when not provided.
         """
         try:
             # Validate position has required fields
@@ -700,11 +786,16 @@ class GatewayTransactionPoller:
 
             # Get individual position info from Gateway (includes pending fees)
             try:
-                result = await self.gateway_client.clmm_position_info(
-                    connector=position.connector,
-                    chain_network=position.network,  # position.network is already in 'chain-network' format
-                    position_address=position.position_address
-                )
+                if position_info is _NOT_PREFETCHED:
+                    result = await self.gateway_client.clmm_position_info(
+                        connector=position.connector,
+                        chain_network=position.network,  # position.network is already in 'chain-network' format
+                        position_address=position.position_address
+                    )
+                elif isinstance(position_info, Exception):
+                    raise position_info
+                else:
+                    result = position_info
 
                 # Check for Gateway errors
                 if result is None:
@@ -788,9 +879,10 @@ class GatewayTransactionPoller:
                 quote_fee_pending=quote_fee_pending
             )
 
-            logger.debug(f"Refreshed position {position.position_address}: price={current_price}, in_range={in_range}, "
-                        f"base={base_token_amount}, quote={quote_token_amount}, "
-                        f"base_fee={base_fee_pending}, quote_fee={quote_fee_pending}")
+            # Lazy %-formatting: the Decimals are only rendered when DEBUG is enabled (runs per open position)
+            logger.debug("Refreshed position %s: price=%s, in_range=%s, base=%s, quote=%s, base_fee=%s, quote_fee=%s",
+                         position.position_address, current_price, in_range, base_token_amount, quote_token_amount,
+                         base_fee_pending, quote_fee_pending)
 
         except Exception as e:
             logger.error(f"Error refreshing position state {position.position_address}: {e}", exc_info=True)
@@ -64,12 +64,13 @@ class GatewayWalletService:
         try:
             wallets = await self.gateway_client.get_wallets()
 
-            # Enrich with default wallet info for each chain
-            for wallet_group in wallets:
-                chain = wallet_group.get("chain")
-                if chain:
-                    default_wallet = await self.gateway_client.get_default_wallet_address(chain)
-                    wallet_group["default_address"] = default_wallet or ""
+            # Enrich with default wallet info for each chain (lookups are independent, fetch concurrently)
+            chain_groups = [wallet_group for wallet_group in wallets if wallet_group.get("chain")]
+            default_wallets = await asyncio.gather(
+                *(self.gateway_client.get_default_wallet_address(wallet_group["chain"]) for wallet_group in chain_groups)
+            )
+            for wallet_group, default_wallet in zip(chain_groups, default_wallets):
+                wallet_group["default_address"] = default_wallet or ""
 
             return wallets
         except Exception as e:
@@ -42,40 +42,44 @@ class PortfolioAnalyticsService:
                         for token_info in connector_data:
                             token = token_info.get("token", "")
                             value = token_info.get("value", 0)
+                            units = token_info.get("units", 0)
 
-                            if token not in token_values:
-                                token_values[token] = {
+                            # Resolve each aggregation level once instead of re-indexing per field
+                            token_totals = token_values.get(token)
+                            if token_totals is None:
+                                token_totals = token_values[token] = {
                                     "token": token,
                                     "total_value": 0,
                                     "total_units": 0,
                                     "accounts": {}
                                 }
 
-                            token_values[token]["total_value"] += value
-                            token_values[token]["total_units"] += token_info.get("units", 0)
+                            token_totals["total_value"] += value
+                            token_totals["total_units"] += units
                             total_value += value
 
                             # Track by account
-                            if acc_name not in token_values[token]["accounts"]:
-                                token_values[token]["accounts"][acc_name] = {
+                            account_totals = token_totals["accounts"].get(acc_name)
+                            if account_totals is None:
+                                account_totals = token_totals["accounts"][acc_name] = {
                                     "value": 0,
                                     "units": 0,
                                     "connectors": {}
                                 }
 
-                            token_values[token]["accounts"][acc_name]["value"] += value
-                            token_values[token]["accounts"][acc_name]["units"] += token_info.get("units", 0)
+                            account_totals["value"] += value
+                            account_totals["units"] += units
 
                             # Track by connector within account
-                            if connector_name not in token_values[token]["accounts"][acc_name]["connectors"]:
-                                token_values[token]["accounts"][acc_name]["connectors"][connector_name] = {
+                            connector_totals = account_totals["connectors"].get(connector_name)
+                            if connector_totals is None:
+                                connector_totals = account_totals["connectors"][connector_name] = {
                                     "value": 0,
                                     "units": 0
                                 }
 
-                            connector_totals = token_values[token]["accounts"][acc_name]["connectors"][connector_name]
                             connector_totals["value"] += value
-                            connector_totals["units"] += token_info.get("units", 0)
+                            connector_totals["units"] += units
 
             # Calculate percentages
             distribution = []
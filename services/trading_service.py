@@ -88,9 +88,14 @@ class AccountTradingInterface:
         """Return current timestamp (updated by control loop)."""
         return self._current_timestamp
 
-    def update_timestamp(self):
-        """Update the current timestamp. Called by ExecutorService control loop."""
-        self._current_timestamp = time.time()
+    def update_timestamp(self, timestamp: Optional[float] = None):
+        """
+        Update the current timestamp. Called by ExecutorService control loop.
+
+        Args:
+            timestamp: Tick timestamp shared across interfaces (defaults to the current time)
+        """
+        self._current_timestamp = timestamp if timestamp is not None else time.time()
 
     async def ensure_connector(self, connector_name: str) -> ConnectorBase:
         """
@@ -462,8 +467,10 @@ class TradingService:
 
     def update_all_timestamps(self):
         """Update timestamps for all trading interfaces. Called by executor control loop."""
+        # Read the clock once per tick so every interface sees the same timestamp
+        timestamp = time.time()
         for interface in self._trading_interfaces.values():
-            interface.update_timestamp()
+            interface.update_timestamp(timestamp)
 
     # ==================== Properties ====================
 
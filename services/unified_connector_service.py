@@ -545,11 +545,16 @@ class UnifiedConnectorService:
         trading_pair: str,
         timeout: float
     ) -> bool:
-        """Wait for order book to have valid bid/ask data."""
-        waited = 0
-        interval = 0.5
+        """Wait for order book to have valid bid/ask data.
 
-        while waited < timeout:
+        The tracker exposes no per-pair readiness signal, so this polls - starting with a short
+        interval that doubles up to 0.5s, so books that fill quickly are picked up without a
+        fixed half-second delay.
+        """
+        deadline = time.monotonic() + timeout
+        interval = 0.05
+
+        while time.monotonic() < deadline:
             if trading_pair in tracker.order_books:
                 ob = tracker.order_books[trading_pair]
                 try:
@@ -563,7 +568,7 @@ class UnifiedConnectorService:
                 except Exception:
                     pass
             await asyncio.sleep(interval)
-            waited += interval
+            interval = min(interval * 2, 0.5)
 
         logger.warning(f"Timeout waiting for {trading_pair} order book")
         return False
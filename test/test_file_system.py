@@ -0,0 +1,77 @@
+"""
+Tests for FileSystemUtil module reloading.
+
+Run with: pytest test/test_file_system.py -v
+"""
+import importlib
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("hummingbot")
+
+MODULE_NAME = "reload_probe_module"
+
+
+@pytest.fixture
+def probe_module(tmp_path, monkeypatch):
+    """Write a throwaway module to tmp_path and make it importable."""
+    from utils.file_system import FileSystemUtil
+
+    module_path = tmp_path / f"{MODULE_NAME}.py"
+    module_path.write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+    reload_calls = []
+    original_reload = importlib.reload
+
+    def spy_reload(module):
+        reload_calls.append(module.__name__)
+        return original_reload(module)
+
+    monkeypatch.setattr(importlib, "reload", spy_reload)
+    yield module_path, reload_calls
+
+    sys.modules.pop(MODULE_NAME, None)
+    FileSystemUtil._module_signatures.pop(MODULE_NAME, None)
+
+
+class TestImportOrReload:
+    """Tests for FileSystemUtil._import_or_reload."""
+
+    def test_unchanged_module_is_not_reloaded(self, probe_module):
+        """A second lookup of an untouched module should reuse the loaded module."""
+        from utils.file_system import FileSystemUtil
+
+        _, reload_calls = probe_module
+        first = FileSystemUtil._import_or_reload(MODULE_NAME)
+        second = FileSystemUtil._import_or_reload(MODULE_NAME)
+
+        assert second is first
+        assert reload_calls == []
+
+    def test_touched_module_is_reloaded(self, probe_module):
+        """A newer mtime should trigger a reload even if the content is the same."""
+        from utils.file_system import FileSystemUtil
+
+        module_path, reload_calls = probe_module
+        FileSystemUtil._import_or_reload(MODULE_NAME)
+        stat = os.stat(module_path)
+        os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        FileSystemUtil._import_or_reload(MODULE_NAME)
+
+        assert reload_calls == [MODULE_NAME]
+
+    def test_edited_module_picks_up_new_source(self, probe_module):
+        """Editing the source should reload it and expose the new definitions."""
+        from utils.file_system import FileSystemUtil
+
+        module_path, reload_calls = probe_module
+        assert FileSystemUtil._import_or_reload(MODULE_NAME).VALUE == 1
+        module_path.write_text("VALUE = 22\n")
+        module = FileSystemUtil._import_or_reload(MODULE_NAME)
+
+        assert module.VALUE == 22
+        assert reload_calls == [MODULE_NAME]
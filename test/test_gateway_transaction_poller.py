@@ -0,0 +1,60 @@
+"""
+Tests for the Gateway transaction poller's adaptive poll interval.
+
+Run with: pytest test/test_gateway_transaction_poller.py -v
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiohttp")
+
+
+@pytest.fixture
+def poller():
+    from services.gateway_transaction_poller import GatewayTransactionPoller
+
+    return GatewayTransactionPoller(MagicMock(), MagicMock(), poll_interval=10)
+
+
+class TestAdaptivePollInterval:
+    """Tests for GatewayTransactionPoller._next_poll_interval."""
+
+    def test_new_pending_transaction_starts_at_minimum(self, poller):
+        """A newly pending transaction should drop the interval to MIN_POLL_INTERVAL."""
+        assert poller._next_poll_interval(10, {"0xa"}, set()) == poller.MIN_POLL_INTERVAL
+
+    def test_interval_doubles_while_no_new_transactions(self, poller):
+        """With the same transactions still pending, the interval should double each poll."""
+        delay = poller._next_poll_interval(10, {"0xa"}, set())
+        delays = []
+        for _ in range(3):
+            delay = poller._next_poll_interval(delay, {"0xa"}, {"0xa"})
+            delays.append(delay)
+
+        assert delays == [2.0, 4.0, 8.0]
+
+    def test_interval_keeps_backing_off_as_transactions_confirm(self, poller):
+        """Confirmations without new arrivals should not reset the interval."""
+        assert poller._next_poll_interval(4.0, {"0xa"}, {"0xa", "0xb"}) == 8.0
+
+    def test_interval_capped_at_poll_interval(self, poller):
+        """Doubling should never exceed poll_interval."""
+        delay = poller.MIN_POLL_INTERVAL
+        for _ in range(10):
+            delay = poller._next_poll_interval(delay, {"0xa", "0xb"}, {"0xa", "0xb"})
+
+        assert delay == poller.poll_interval
+
+    def test_interval_resets_when_new_transaction_pending(self, poller):
+        """A further pending transaction should reset a backed-off interval to the minimum."""
+        assert poller._next_poll_interval(8.0, {"0xa", "0xb"}, {"0xa"}) == poller.MIN_POLL_INTERVAL
+
+    def test_interval_resets_when_one_confirms_and_another_arrives(self, poller):
+        """A new hash should reset the interval even if the pending count is unchanged."""
+        assert poller._next_poll_interval(8.0, {"0xb"}, {"0xa"}) == poller.MIN_POLL_INTERVAL
+
+    def test_nothing_pending_uses_poll_interval(self, poller):
+        """With nothing pending the poller should fall back to poll_interval."""
+        assert poller._next_poll_interval(2.0, set(), {"0xa"}) == poller.poll_interval
@@ -95,3 +95,185 @@ class TestBalanceRefresh:
         assert len(result) == 1
         assert result[0]["token"] == "USDT"
         assert result[0]["units"] == 500.0
+
+
+class TestAccountStateUpdateCoalescing:
+    """Tests for single-flight update_account_state."""
+
+    @pytest.fixture
+    def accounts_service(self):
+        """Create AccountsService with a gated _update_account_state."""
+        import asyncio
+
+        from services.accounts_service import AccountsService
+
+        service = AccountsService.__new__(AccountsService)
+        service.accounts_state = {}
+        service._account_state_updates = {}
+        service._state_generation = 0
+        service.release_update = asyncio.Event()
+
+        async def gated_update(*args, **kwargs):
+            await service.release_update.wait()
+
+        service._update_account_state = AsyncMock(side_effect=gated_update)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_update(self, accounts_service):
+        """Identical calls made while an update is in flight should join it."""
+        import asyncio
+
+        first = asyncio.create_task(accounts_service.update_account_state())
+        second = asyncio.create_task(accounts_service.update_account_state())
+        await asyncio.sleep(0)
+        accounts_service.release_update.set()
+        await asyncio.gather(first, second)
+
+        accounts_service._update_account_state.assert_called_once()
+        assert accounts_service._account_state_updates == {}
+
+    @pytest.mark.asyncio
+    async def test_update_after_credentials_change_does_not_join_stale_update(self, accounts_service):
+        """add_credentials must start its own update rather than join one started before the change."""
+        import asyncio
+
+        accounts_service._connector_service = MagicMock()
+        accounts_service._connector_service.update_connector_keys = AsyncMock()
+
+        in_flight = asyncio.create_task(accounts_service.update_account_state())
+        await asyncio.sleep(0)
+        adding = asyncio.create_task(
+            accounts_service.add_credentials("test_account_coalescing", "binance", {"api_key": "k"})
+        )
+        await asyncio.sleep(0)
+        accounts_service.release_update.set()
+        await asyncio.gather(in_flight, adding)
+
+        assert accounts_service._update_account_state.call_count == 2
+
+
+class TestLastTradedPriceTimeout:
+    """Tests for _safe_get_last_traded_prices partial results on timeout."""
+
+    @pytest.fixture
+    def accounts_service(self):
+        """Create AccountsService with an empty price cache."""
+        from collections import OrderedDict
+
+        from services.accounts_service import AccountsService
+
+        service = AccountsService.__new__(AccountsService)
+        service._last_known_prices = OrderedDict({"ETH-USDT": Decimal("3000")})
+        return service
+
+    @pytest.mark.asyncio
+    async def test_keeps_finished_prices_and_falls_back_for_pending(self, accounts_service):
+        """A pair that hangs past the timeout uses its cached price; finished pairs keep theirs."""
+        import asyncio
+
+        hung_cancelled = asyncio.Event()
+
+        async def last_traded_price(trading_pair):
+            if trading_pair == "ETH-USDT":
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    hung_cancelled.set()
+                    raise
+            return Decimal("50000")
+
+        connector = MagicMock()
+        connector._get_last_traded_price = AsyncMock(side_effect=last_traded_price)
+
+        prices = await accounts_service._safe_get_last_traded_prices(
+            connector, ["BTC-USDT", "ETH-USDT"], timeout=0.1
+        )
+
+        assert prices == {"BTC-USDT": Decimal("50000"), "ETH-USDT": Decimal("3000")}
+        assert accounts_service._last_known_prices["BTC-USDT"] == Decimal("50000")
+        await asyncio.wait_for(hung_cancelled.wait(), timeout=1)
+
+
+class TestLastKnownPriceCache:
+    """Tests for the bounded last-known price cache."""
+
+    @pytest.fixture
+    def accounts_service(self):
+        """Create AccountsService with a small price cache."""
+        from collections import OrderedDict
+
+        from services.accounts_service import AccountsService
+
+        service = AccountsService.__new__(AccountsService)
+        service._last_known_prices = OrderedDict()
+        service.MAX_CACHED_PRICES = 2
+        return service
+
+    def test_evicts_oldest_price_at_capacity(self, accounts_service):
+        """Adding a pair beyond capacity should drop the least recently stored one."""
+        accounts_service._remember_price("BTC-USDT", Decimal("50000"))
+        accounts_service._remember_price("ETH-USDT", Decimal("3000"))
+        accounts_service._remember_price("SOL-USDT", Decimal("150"))
+
+        assert list(accounts_service._last_known_prices) == ["ETH-USDT", "SOL-USDT"]
+
+    def test_refresh_moves_pair_to_end(self, accounts_service):
+        """Re-storing a pair should protect it from the next eviction."""
+        accounts_service._remember_price("BTC-USDT", Decimal("50000"))
+        accounts_service._remember_price("ETH-USDT", Decimal("3000"))
+        accounts_service._remember_price("BTC-USDT", Decimal("51000"))
+        accounts_service._remember_price("SOL-USDT", Decimal("150"))
+
+        assert list(accounts_service._last_known_prices) == ["BTC-USDT", "SOL-USDT"]
+        assert accounts_service._last_known_prices["BTC-USDT"] == Decimal("51000")
+
+
+class TestDeleteAccountDuringRefresh:
+    """Tests that in-flight refreshes don't resurrect deleted accounts."""
+
+    @pytest.fixture
+    def accounts_service(self, monkeypatch):
+        """Create AccountsService with one account whose connector refresh is gated."""
+        import asyncio
+
+        from services import accounts_service as accounts_service_module
+        from services.accounts_service import AccountsService
+
+        monkeypatch.setattr(accounts_service_module.fs_util, "delete_folder", MagicMock())
+
+        service = AccountsService.__new__(AccountsService)
+        service.accounts_state = {"master_account": {}}
+        service._state_generation = 0
+        service.release_refresh = asyncio.Event()
+
+        service._connector_service = MagicMock()
+        service._connector_service.get_all_trading_connectors.return_value = {
+            "master_account": {"binance": MagicMock()}
+        }
+        service._connector_service.list_account_connectors.return_value = ["binance"]
+        service._connector_service.stop_trading_connector = AsyncMock()
+
+        async def gated_tokens_info(connector, connector_name, *args, **kwargs):
+            await service.release_refresh.wait()
+            return [{"token": "USDT", "units": 100.0}]
+
+        service._get_connector_tokens_info = AsyncMock(side_effect=gated_tokens_info)
+        return service
+
+    @pytest.mark.asyncio
+    async def test_deleted_account_stays_gone(self, accounts_service):
+        """A connector result arriving after delete_account should not recreate the account."""
+        import asyncio
+
+        refresh = asyncio.create_task(
+            accounts_service._update_account_state(skip_gateway=True, account_names=None, connector_names=None)
+        )
+        await asyncio.sleep(0)
+        accounts_service._get_connector_tokens_info.assert_called_once()
+
+        await accounts_service.delete_account("master_account")
+        accounts_service.release_refresh.set()
+        await refresh
+
+        assert "master_account" not in accounts_service.accounts_state
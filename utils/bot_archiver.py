@@ -2,15 +2,14 @@ import logging
 import os
 import shutil
 
-import boto3
-from botocore.exceptions import NoCredentialsError
-
 logger = logging.getLogger(__name__)
 
 
 class BotArchiver:
     def __init__(self, aws_access_key_id=None, aws_secret_access_key=None, default_bucket_name=None):
         if aws_access_key_id and aws_secret_access_key:
+            # Imported lazily: boto3 is slow to import and only needed when S3 archiving is configured
+            import boto3
             self.s3 = boto3.client('s3', aws_access_key_id=aws_access_key_id,
                                    aws_secret_access_key=aws_secret_access_key)
             self.default_bucket_name = default_bucket_name
@@ -21,6 +20,7 @@ class BotArchiver:
     def archive_and_upload(self, instance_name, instance_dir, bucket_name=None):
         if not self.s3:
             raise ValueError("AWS S3 credentials are not provided.")
+        from botocore.exceptions import NoCredentialsError
 
         if bucket_name is None:
             bucket_name = self.default_bucket_name
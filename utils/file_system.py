@@ -270,6 +270,49 @@ class FileSystemUtil:
             except yaml.YAMLError as e:
                 raise yaml.YAMLError(f"Invalid YAML in file '{file_path}': {e}")
 
+    # Source (st_mtime_ns, st_size) of dynamically loaded script/controller modules, keyed by module name
+    _module_signatures: dict = {}
+
+    @staticmethod
+    def _source_signature(module) -> Optional[tuple]:
+        """
+        Returns the (st_mtime_ns, st_size) of a module's source file, or None if it can't be read.
+        """
+        module_file = getattr(module, "__file__", None)
+        if not module_file:
+            return None
+        try:
+            stat = os.stat(module_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _import_or_reload(module_name: str):
+        """
+        Imports a module, reloading it only if its source file changed since the last load.
+        Avoids re-executing unchanged scripts/controllers on every config-class lookup while
+        still picking up edits made through the API. Changes are detected by nanosecond mtime
+        plus size, so an edit is only missed if it keeps the same size within one tick of a
+        coarse-grained filesystem clock.
+        :param module_name: Dotted module name to import.
+        :return: The imported module.
+        """
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = importlib.import_module(module_name)
+        else:
+            signature = FileSystemUtil._source_signature(module)
+            if signature is None or signature != FileSystemUtil._module_signatures.get(module_name):
+                module = importlib.reload(module)
+
+        signature = FileSystemUtil._source_signature(module)
+        if signature is None:
+            FileSystemUtil._module_signatures.pop(module_name, None)
+        else:
+            FileSystemUtil._module_signatures[module_name] = signature
+        return module
+
     @staticmethod
     def load_script_config_class(script_name: str) -> Optional[Type[BaseClientModel]]:
         """
@@ -280,10 +323,7 @@ class FileSystemUtil:
         try:
             # Assuming scripts are in a package named 'scripts'
             module_name = f"bots.scripts.{script_name.replace('.py', '')}"
-            if module_name not in sys.modules:
-                script_module = importlib.import_module(module_name)
-            else:
-                script_module = importlib.reload(sys.modules[module_name])
+            script_module = FileSystemUtil._import_or_reload(module_name)
 
             # Find the subclass of BaseClientModel in the module
             for _, cls in inspect.getmembers(script_module, inspect.isclass):
@@ -314,10 +354,7 @@ class FileSystemUtil:
 
         for module_name in module_paths:
             try:
-                if module_name not in sys.modules:
-                    script_module = importlib.import_module(module_name)
-                else:
-                    script_module = importlib.reload(sys.modules[module_name])
+                script_module = FileSystemUtil._import_or_reload(module_name)
 
                 # Find the subclass of controller config base in the module
                 for _, cls in inspect.getmembers(script_module, inspect.isclass):
@@ -1,6 +1,8 @@
 import asyncio
 import json
 import logging
+import random
+import signal
 import time
 from collections import defaultdict, deque
 from contextlib import asynccontextmanager
@@ -40,7 +42,9 @@ class MQTTManager:
 
         # Connection state
         self._connected = False
-        self._reconnect_interval = 5  # seconds
+        self._reconnect_interval = 5  # seconds, initial delay before reconnecting
+        self._max_reconnect_interval = 60  # seconds, cap for the exponential backoff
+        self._reconnect_attempts = 0  # consecutive failed connections, reset once connected
         self._client: Optional[aiomqtt.Client] = None
         self._tasks: Set[asyncio.Task] = set()
 
@@ -84,6 +88,7 @@ class MQTTManager:
 
         async with client:
             self._connected = True
+            self._reconnect_attempts = 0
             logger.info(f"✓ Connected to MQTT broker at {self.host}:{self.port}")
 
             # Subscribe to topics
@@ -103,11 +108,19 @@ class MQTTManager:
                     async for message in client.messages:
                         await self._process_message(message)
             except aiomqtt.MqttError as error:
-                logger.error(f'MQTT disconnected during message iteration: "{error}". Reconnecting...')
-                await asyncio.sleep(self._reconnect_interval)
+                delay = self._next_reconnect_delay()
+                logger.error(f'MQTT disconnected during message iteration: "{error}". Reconnecting in {delay:.1f}s...')
+                await asyncio.sleep(delay)
             except Exception as e:
-                logger.error(f"Unexpected error in message handler: {e}. Reconnecting...")
-                await asyncio.sleep(self._reconnect_interval)
+                delay = self._next_reconnect_delay()
+                logger.error(f"Unexpected error in message handler: {e}. Reconnecting in {delay:.1f}s...")
+                await asyncio.sleep(delay)
+
+    def _next_reconnect_delay(self) -> float:
+        """Exponential backoff with jitter so an unavailable broker isn't hammered at a fixed rate."""
+        delay = min(self._max_reconnect_interval, self._reconnect_interval * 2 ** min(self._reconnect_attempts, 8))
+        self._reconnect_attempts += 1
+        return delay * (0.5 + random.random() / 2)
 
     async def _process_message(self, message):
         """Process incoming MQTT message."""
@@ -547,14 +560,32 @@ if __name__ == "__main__":
 
     async def main():
         mqtt_manager = MQTTManager(host="localhost", port=1883, username="", password="")
+        stop_event = asyncio.Event()
+
+        # Stop on SIGINT/SIGTERM via the running loop; degrade gracefully where loop signal
+        # handlers are unavailable (Windows, non-main threads)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                pass
 
         await mqtt_manager.start()
 
         try:
             # Keep running to listen for messages
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
+            await stop_event.wait()
+        finally:
             await mqtt_manager.stop()
 
-    asyncio.run(main())
+    run = asyncio.run
+    if sys.platform != "win32":
+        # Prefer the libuv-based event loop when available
+        try:
+            import uvloop
+            run = uvloop.run
+        except ImportError:
+            pass
+
+    run(main())